@@ -3,124 +3,387 @@ Simple HTTP Server for CONSIM Demo
 Serves the Three.js frontend and provides basic API endpoints.
 """
 
+import gzip
 import http.server
 import socketserver
 import json
-import urllib.parse
+import logging
+import math
+import os
+import threading
+import time
 import sys
 from pathlib import Path
 
+# Optional orjson import for faster response encoding
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from lattice_demo import ConsciousnessLattice
 
+logger = logging.getLogger(__name__)
+
+# Static files are served relative to this script
+SERVE_DIR = str(Path(__file__).parent)
+
+def encode_json(data) -> bytes:
+    """Encode a response body as UTF-8 JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode('utf-8')
+
+def decode_json(body: bytes):
+    """Decode a UTF-8 JSON request body, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# POST bodies are small fixed-schema JSON; anything bigger is rejected
+MAX_BODY_BYTES = 64 * 1024
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+
+# The simulation advances on a single background thread at a fixed rate.
+TICK_RATE = 60
+
+def run_simulation(state, stop_event):
+    """Advance the lattice at TICK_RATE until stop_event is set.
+
+    A frame that raises is logged and skipped, so one bad update can't stop
+    the simulation; a repeating error is logged once until it changes.
+    """
+    frame_time = 1.0 / TICK_RATE
+    next_deadline = time.monotonic()
+    last_error = None
+    
+    while not stop_event.is_set():
+        try:
+            with state.lock:
+                state.lattice.update(frame_time)
+        except Exception as e:
+            if repr(e) != last_error:
+                logger.exception("Simulation tick failed")
+                last_error = repr(e)
+        else:
+            if last_error is not None:
+                logger.info("Simulation tick recovered")
+                last_error = None
+        state.mark_changed()
+        
+        # Schedule against a fixed deadline so timing errors don't accumulate
+        next_deadline += frame_time
+        delay = next_deadline - time.monotonic()
+        if delay < 0:
+            next_deadline = time.monotonic()
+            delay = 0
+        stop_event.wait(delay)
+
+def serialize_clusters(clusters):
+    """Serialize clusters with node positions instead of node objects."""
+    return [
+        {
+            **{key: value for key, value in cluster.items() if key != 'nodes'},
+            'nodes': [{'id': node.node_id, 'x': node.x, 'y': node.y} for node in cluster['nodes']]
+        }
+        for cluster in clusters
+    ]
+
+class ServerState:
+    """The lattice shared by the simulation thread and request handlers.
+
+    Handlers take `lock` before touching the lattice. Serialized /api/state
+    snapshots are cached per version; the version is bumped by every change
+    to the lattice, so concurrent polls within one frame share one encoding.
+    """
+    __slots__ = ('lattice', 'lock', 'cache_lock', 'version',
+                 'status_cache', 'state_cache')
+    
+    def __init__(self, lattice):
+        self.lattice = lattice
+        self.lock = threading.RLock()
+        self.cache_lock = threading.Lock()
+        self.version = 0
+        self.status_cache = (None, None)
+        self.state_cache = None
+    
+    def mark_changed(self):
+        """Invalidate the cached /api/state snapshot."""
+        with self.cache_lock:
+            self.version += 1
+    
+    def global_stats(self):
+        """Return global consciousness stats (cached by the lattice between changes)."""
+        with self.lock:
+            return self.lattice._calculate_global_consciousness()
+    
+    def status_bytes(self):
+        """Return the encoded /api/status body, re-encoded at most once per version."""
+        version, body = self.status_cache
+        if version != self.version:
+            with self.lock:
+                version = self.version
+                lattice = self.lattice
+                body = encode_json({
+                    'running': True,
+                    'node_count': len(lattice.nodes),
+                    'cluster_count': len(lattice.clusters),
+                    'time': lattice.time
+                })
+            self.status_cache = (version, body)
+        return body
+    
+    def snapshot(self):
+        """Return the serialized state for the current version, building it if needed."""
+        with self.cache_lock:
+            if self.state_cache is not None and self.state_cache['version'] == self.version:
+                return self.state_cache
+            
+            with self.lock:
+                lattice = self.lattice
+                # Single pass over the lattice; stats come from the lattice's cache
+                serialized_state = {
+                    'nodes': [node.to_dict() for node in lattice.nodes],
+                    'universes': [universe.to_dict() for universe in lattice.universes],
+                    'clusters': serialize_clusters(lattice.clusters),
+                    'global_stats': self.global_stats(),
+                    'params': dict(lattice.params),
+                    'lambdas': lattice.lambdas,
+                    'time': lattice.time
+                }
+            
+            self.state_cache = {
+                'version': self.version,
+                'bytes': encode_json(serialized_state)
+            }
+            return self.state_cache
+    
+    def gzip_body(self, body: bytes, cache=None) -> bytes:
+        """Gzip a response body, sharing one compression per cached snapshot."""
+        if cache is None:
+            return gzip.compress(body, compresslevel=1)
+        
+        with self.cache_lock:
+            if 'gzip' not in cache:
+                cache['gzip'] = gzip.compress(body, compresslevel=1)
+            return cache['gzip']
+
 class ConsciousnessHTTPHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP handler with API support for consciousness lattice."""
     
+    # Keep connections open between requests; idle ones are dropped after
+    # a few seconds. An idle connection holds only its own thread, never one
+    # of the server's request slots.
+    protocol_version = 'HTTP/1.1'
+    timeout = 5
+    
+    # Shared ServerState, attached by start_server()
+    state = None
+    
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=str(Path(__file__).parent), **kwargs)
+        super().__init__(*args, directory=SERVE_DIR, **kwargs)
         
     def do_GET(self):
         """Handle GET requests."""
-        if self.path == '/':
-            self.path = '/static/index.html'
-        elif self.path.startswith('/api/'):
-            self.handle_api_get()
-            return
-        
-        super().do_GET()
+        with self.server.request_slots:
+            path, _, query = self.path.partition('?')
+            if path == '/':
+                self.path = '/static/index.html'
+            else:
+                handler = self.GET_ROUTES.get(path)
+                if handler is not None:
+                    handler(self, query)
+                    return
+            
+            super().do_GET()
     
     def do_POST(self):
         """Handle POST requests."""
-        if self.path.startswith('/api/'):
-            self.handle_api_post()
-        else:
-            self.send_error(404)
+        with self.server.request_slots:
+            handler = self.POST_ROUTES.get(self.path)
+            if handler is None:
+                # The body was never read, so the connection can't be reused
+                self.close_connection = True
+                self.send_error(404)
+                return
+            
+            data = self.read_json_body()
+            if data is not None:
+                handler(self, data)
     
-    def handle_api_get(self):
-        """Handle API GET requests."""
-        global lattice
-        
-        if self.path == '/api/status':
-            status = {
-                'running': True,
-                'node_count': len(lattice.nodes),
-                'cluster_count': len(lattice.clusters),
-                'time': lattice.time
-            }
-            self.send_json_response(status)
-        
-        elif self.path == '/api/stats':
-            stats = lattice._calculate_global_consciousness()
-            self.send_json_response(stats)
-        
-        elif self.path == '/api/state':
-            # Get current lattice state
-            state = lattice.get_state_for_transmission()
-            # Serialize nodes properly
-            serialized_state = {
-                'nodes': [node.to_dict() for node in lattice.nodes],
-                'universes': [universe.to_dict() for universe in lattice.universes],
-                'clusters': lattice.clusters,
-                'global_stats': lattice._calculate_global_consciousness(),
-                'params': lattice.params,
-                'lambdas': lattice.lambdas,
-                'time': lattice.time
-            }
-            self.send_json_response(serialized_state)
-        
+    def copyfile(self, source, outputfile):
+        """Send static files with socket.sendfile() (zero-copy on Linux).
+
+        socket.sendfile falls back to plain send() for in-memory sources such
+        as directory listings, so no special-casing is needed here.
+        """
+        if outputfile is self.wfile:
+            self.connection.sendfile(source)
         else:
-            self.send_error(404)
+            super().copyfile(source, outputfile)
     
-    def handle_api_post(self):
-        """Handle API POST requests."""
-        global lattice
+    def read_json_body(self):
+        """Read and decode the POST body, replying with an error and returning None if invalid."""
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            self.close_connection = True
+            self.send_error(400, "Invalid Content-Length")
+            return None
         
-        content_length = int(self.headers['Content-Length'])
-        post_data = self.rfile.read(content_length)
+        if content_length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self.send_error(413, "Request body too large")
+            return None
+        
+        post_data = self.rfile.read(content_length) if content_length > 0 else b'{}'
         
         try:
-            data = json.loads(post_data.decode('utf-8'))
-        except json.JSONDecodeError:
+            return decode_json(post_data)
+        except ValueError:
             self.send_error(400, "Invalid JSON")
+            return None
+    
+    # API GET handlers
+    
+    def api_status(self, query):
+        """GET /api/status - simulation status."""
+        self.send_json_bytes(self.state.status_bytes())
+    
+    def api_stats(self, query):
+        """GET /api/stats - global consciousness statistics."""
+        self.send_json_response(self.state.global_stats())
+    
+    def api_state(self, query):
+        """GET /api/state - full lattice state."""
+        snapshot = self.state.snapshot()
+        self.send_json_bytes(snapshot['bytes'], cache=snapshot)
+    
+    # API POST handlers
+    
+    def api_update(self, data):
+        """POST /api/update - report the current simulation time."""
+        # The simulation thread advances the lattice; just report where it is
+        self.send_json_response({'status': 'ok', 'time': self.state.lattice.time})
+    
+    def api_parameters(self, data):
+        """POST /api/parameters - update physics parameters from {"name": number, ...}."""
+        if not isinstance(data, dict):
+            self.send_error(400, "Expected an object of parameter values")
+            return
+        try:
+            data = {str(name): self.coerce_param(value) for name, value in data.items()}
+        except (TypeError, ValueError):
+            self.send_error(400, "Parameter values must be finite numbers")
             return
         
-        if self.path == '/api/update':
-            # Update lattice
-            lattice.update(0.016)  # ~60fps
-            self.send_json_response({'status': 'updated'})
-        
-        elif self.path == '/api/parameters':
-            # Update parameters
-            lattice.update_params(data)
-            self.send_json_response({'status': 'updated', 'parameters': data})
-        
-        elif self.path == '/api/nodes':
-            # Add new node
-            node = lattice.add_node(data.get('x', 0), data.get('y', 0))
-            self.send_json_response({'status': 'created', 'node': node.to_dict()})
+        with self.state.lock:
+            self.state.lattice.update_params(data)
+        self.state.mark_changed()
+        self.send_json_response({'status': 'updated', 'parameters': data})
+    
+    def api_nodes(self, data):
+        """POST /api/nodes - add a node at {"x": number, "y": number}."""
+        point = self.read_point(data)
+        if point is None:
+            return
         
-        elif self.path == '/api/collapse':
-            # Trigger quantum collapse
-            lattice.quantum_collapse(data.get('x', 0), data.get('y', 0))
-            self.send_json_response({'status': 'triggered'})
+        with self.state.lock:
+            node = self.state.lattice.add_node(*point)
+            node_data = node.to_dict()
+        self.state.mark_changed()
+        self.send_json_response({'status': 'created', 'node': node_data})
+    
+    def api_nodes_bulk(self, data):
+        """POST /api/nodes/bulk - add several nodes from {"points": [[x, y], ...]}."""
+        try:
+            points = [(float(x), float(y)) for x, y in data.get('points', [])]
+        except (AttributeError, TypeError, ValueError):
+            self.send_error(400, "Expected points as [[x, y], ...]")
+            return
         
-        elif self.path == '/api/reset':
-            # Reset simulation
-            lattice = ConsciousnessLattice(grid_size=64)
-            self.send_json_response({'status': 'reset'})
+        with self.state.lock:
+            node_ids = [self.state.lattice.add_node(x, y).node_id for x, y in points]
+        self.state.mark_changed()
+        self.send_json_response({'status': 'created', 'ids': node_ids})
+    
+    def api_collapse(self, data):
+        """POST /api/collapse - trigger a quantum collapse at {"x": number, "y": number}."""
+        point = self.read_point(data)
+        if point is None:
+            return
         
-        else:
-            self.send_error(404)
+        with self.state.lock:
+            self.state.lattice.quantum_collapse(*point)
+        self.state.mark_changed()
+        self.send_json_response({'status': 'triggered'})
+    
+    def api_reset(self, data):
+        """POST /api/reset - reset the simulation."""
+        with self.state.lock:
+            self.state.lattice.reset_in_place()
+        self.state.mark_changed()
+        self.send_json_response({'status': 'reset'})
+    
+    def read_point(self, data):
+        """Return (x, y) from a body whose missing coordinates default to 0, or reply 400 and return None."""
+        try:
+            if not isinstance(data, dict):
+                raise TypeError("Not an object")
+            return self.coerce_param(data.get('x', 0)), self.coerce_param(data.get('y', 0))
+        except (TypeError, ValueError):
+            self.send_error(400, "Expected {\"x\": number, \"y\": number}")
+            return None
+    
+    @staticmethod
+    def coerce_param(value) -> float:
+        """Convert a JSON parameter value to float, raising on non-numbers."""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"Not a number: {value!r}")
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"Not finite: {value!r}")
+        return value
+    
+    # Exact-path dispatch tables; anything else falls through to static files
+    GET_ROUTES = {
+        '/api/status': api_status,
+        '/api/stats': api_stats,
+        '/api/state': api_state,
+    }
+    POST_ROUTES = {
+        '/api/update': api_update,
+        '/api/parameters': api_parameters,
+        '/api/nodes': api_nodes,
+        '/api/nodes/bulk': api_nodes_bulk,
+        '/api/collapse': api_collapse,
+        '/api/reset': api_reset,
+    }
     
     def send_json_response(self, data):
         """Send JSON response."""
-        json_data = json.dumps(data).encode('utf-8')
+        self.send_json_bytes(encode_json(data))
+    
+    def send_json_bytes(self, json_data, cache=None):
+        """Send an already-encoded JSON body, gzipped when the client accepts it."""
+        content_encoding = None
+        if len(json_data) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            json_data = self.state.gzip_body(json_data, cache)
+            content_encoding = 'gzip'
         
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', str(len(json_data)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if content_encoding:
+            self.send_header('Content-Encoding', content_encoding)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
@@ -128,12 +391,36 @@ class ConsciousnessHTTPHandler(http.server.SimpleHTTPRequestHandler):
         
         self.wfile.write(json_data)
 
-# Global lattice instance
-lattice = ConsciousnessLattice(grid_size=64)
+class ConsciousnessHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """Threaded HTTP server that caps how many requests are handled at once.
+
+    Each connection gets its own thread, which idles on its socket between
+    keep-alive requests, so the thread count follows the number of open
+    connections. Handling a request takes one of max_workers slots, which
+    caps how many threads work on the shared lattice at a time; idle
+    connections never hold a slot, so they can't block busy ones.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+    max_workers = (os.cpu_count() or 1) * 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request_slots = threading.BoundedSemaphore(self.max_workers)
 
 def start_server(port=8000):
     """Start the consciousness simulation server."""
-    with socketserver.TCPServer(("", port), ConsciousnessHTTPHandler) as httpd:
+    state = ServerState(ConsciousnessLattice(grid_size=64))
+    ConsciousnessHTTPHandler.state = state
+    lattice = state.lattice
+    
+    stop_event = threading.Event()
+    simulation_thread = threading.Thread(target=run_simulation, args=(state, stop_event),
+                                         name="consim-simulation", daemon=True)
+    simulation_thread.start()
+    
+    with ConsciousnessHTTPServer(("", port), ConsciousnessHTTPHandler) as httpd:
         print(f"🧠 CONSIM Demo Server starting on http://localhost:{port}")
         print(f"✨ Consciousness lattice with {len(lattice.nodes)} nodes initialized")
         print(f"🌌 {len(lattice.universes)} universes with λ weights: {[f'{l:.3f}' for l in lattice.lambdas]}")
@@ -144,6 +431,8 @@ def start_server(port=8000):
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\n🛑 Server stopped")
+        finally:
+            stop_event.set()
 
 if __name__ == "__main__":
     start_server()
\ No newline at end of file
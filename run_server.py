@@ -4,19 +4,36 @@ CONSIM Development Server
 Start the consciousness lattice engine with FastAPI and WebSocket support.
 """
 
+import argparse
 import uvicorn
 import sys
 from pathlib import Path
 
+# uvloop (installed with uvicorn[standard] except on Windows) replaces the
+# default asyncio event loop with a libuv-backed one
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Start the CONSIM server.")
+    parser.add_argument("--reload", action="store_true",
+                        help="restart on code changes (development only; imports everything twice)")
+    args = parser.parse_args()
+    
     uvicorn.run(
         "src.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=args.reload,
+        loop=EVENT_LOOP,
+        # Compress WebSocket frames when the client offers permessage-deflate
+        ws_per_message_deflate=True,
         log_level="info",
         access_log=True
     )
\ No newline at end of file
@@ -8,8 +8,9 @@ This module implements the mathematical foundation of the Multiversal Consciousn
 GPU-optimized with NumPy/PyTorch FFT operations for real-time performance.
 """
 
+import math
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, NamedTuple, Tuple, Optional
 
 # Optional PyTorch import for GPU acceleration
 try:
@@ -20,11 +21,72 @@ except ImportError:
     HAS_TORCH = False
     torch = None
     F = None
+
+# Optional SciPy import for KD-tree neighbour search
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    cKDTree = None
 import time
-import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .lattice_kernels import (
+    HAS_CUDA, HAS_NUMBA, build_spatial_hash, compute_repulsion, compute_repulsion_cuda,
+    cluster_bfs, advance_consciousness, step_nodes, union_find_labels,
+)
+
+# Floating-point dtype of the node columns and scratch buffers. Positions,
+# frequencies and phases need nowhere near double precision, and float32 halves
+# memory traffic and doubles SIMD width; the simulation clock stays a Python float.
+DTYPE = np.float32
+
+# Nodes closer than this may join the same cluster
+CLUSTER_DISTANCE = 80.0
+
+# Cluster topology changes slowly; full detection runs once per this many frames
+CLUSTER_REBUILD_PERIOD = 8
+
+# Nodes leaving [-WORLD_BOUNDS / 2, WORLD_BOUNDS / 2] on an axis bounce or tunnel
+WORLD_BOUNDS = 1000
+
+# Standard deviation of the Gaussian attention field A(x), centred at (0, 0)
+ATTENTION_SIGMA = 200.0
+
+# Rows of the N×N pair matrix the NumPy repulsion fallback evaluates at once
+REPULSION_BLOCK_ROWS = 64
+
+# Lattices at least this large run the pairwise repulsion on CUDA when available
+GPU_MIN_NODES = 2048
+
+# Node fields sent to clients, as (wire key, NodeArrays column) pairs
+NODE_WIRE_FIELDS = (
+    ('id', 'node_id'), ('x', 'x'), ('y', 'y'), ('radius', 'radius'),
+    ('frequency', 'frequency'), ('phase', 'phase'), ('attention', 'attention'),
+    ('consciousness_re', 'consciousness_re'), ('consciousness_im', 'consciousness_im'),
+    ('universe_id', 'universe_id'), ('cluster_id', 'cluster_id'),
+    ('consciousness_depth', 'consciousness_depth'), ('self_awareness', 'self_awareness'),
+    ('thought_intensity', 'thought_intensity'), ('recursion_level', 'recursion_level'),
+)
+
+# Encodings get_state_binary() accepts for float columns: float32, float16, and
+# uint8 quantized linearly over each column's [min, max]
+BINARY_FLOAT_FORMATS = ('f4', 'f2', 'u1')
+
+# Node columns start on cache-line boundaries, which is also the AVX-512 vector width
+COLUMN_ALIGNMENT = 64
+
+def _aligned_empty(shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """np.empty whose data starts on a COLUMN_ALIGNMENT-byte boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + COLUMN_ALIGNMENT, dtype=np.uint8)
+    offset = -raw.ctypes.data % COLUMN_ALIGNMENT
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
 class UniverseMode(Enum):
     CONSCIOUSNESS = "consciousness"
     ATTENTION = "attention" 
@@ -32,11 +94,152 @@ class UniverseMode(Enum):
     TEMPORAL = "temporal"
     MULTIVERSE = "multiverse"
 
-@dataclass
+class PhysicsParams(NamedTuple):
+    """Physics parameters read once per frame, so node updates skip dict lookups."""
+    gravity: float = 0.0
+    friction: float = 0.99
+    elasticity: float = 0.8
+    time_dilation: float = 1.0
+    field_strength: float = 1.0
+    
+    @classmethod
+    def from_dict(cls, params: Dict[str, float]) -> 'PhysicsParams':
+        """Snapshot the known keys of a params dict, defaulting the rest."""
+        return cls(**{name: float(params[name]) for name in cls._fields if name in params})
+
+class NodeArrays:
+    """
+    Structure-of-arrays storage for every node on the lattice.
+    
+    Each per-node field is one contiguous NumPy column, so lattice-wide
+    kernels stream only the fields they touch. Columns are allocated with
+    spare capacity and grown geometrically; only the first `count` rows are
+    live, and the column attributes (`arr.x`, `arr.phase`, ...) return views
+    of exactly those rows. Every column starts on a 64-byte boundary.
+    """
+    
+    FLOAT_DEFAULTS = {
+        'x': 0.0, 'y': 0.0, 'vx': 0.0, 'vy': 0.0,
+        'radius': 3.0, 'base_radius': 3.0,
+        'frequency': 40.0, 'base_frequency': 40.0,
+        'phase': 0.0, 'attention': 0.0, 'attention_raw': 0.0,
+        'consciousness_re': 0.0, 'consciousness_im': 0.0,
+        'resonance_coeff': 1.0, 'mass': 1.0,
+        'consciousness_depth': 0.0, 'self_awareness': 0.0,
+        'adaptive_capacity': 0.0, 'collective_intelligence': 0.0,
+        'thought_intensity': 0.0,
+    }
+    INT_DEFAULTS = {
+        'universe_id': 0, 'universe_slot': 0, 'cluster_id': -1, 'recursion_level': 0, 'node_id': 0,
+    }
+    # Intelligence tensors share one (capacity, 5, 2) column, one slot per tensor
+    TENSOR_SLOTS = ('logic', 'memory', 'processing', 'creativity', 'social')
+    TENSOR_DEFAULTS = {'tensors': 0.5}
+    
+    def __init__(self, capacity: int = 0):
+        self.count = 0
+        self.columns: Dict[str, np.ndarray] = {}
+        for name in self.FLOAT_DEFAULTS:
+            self.columns[name] = _aligned_empty((capacity,), DTYPE)
+        for name in self.INT_DEFAULTS:
+            self.columns[name] = _aligned_empty((capacity,), np.int64 if name == 'node_id' else np.int32)
+        self.columns['tensors'] = _aligned_empty((capacity, len(self.TENSOR_SLOTS), 2), DTYPE)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    @property
+    def capacity(self) -> int:
+        return len(self.columns['x'])
+    
+    def _reserve(self, capacity: int):
+        """Grow every column to hold at least `capacity` rows."""
+        if capacity <= self.capacity:
+            return
+        capacity = max(capacity, 2 * self.capacity, 16)
+        for name, column in self.columns.items():
+            grown = _aligned_empty((capacity,) + column.shape[1:], column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+    
+    def extend(self, n: int, **values) -> int:
+        """Append `n` rows and return the index of the first one.
+        
+        Each keyword is a column name with a scalar or length-`n` value;
+        columns not given are filled with their defaults.
+        """
+        start = self.count
+        stop = start + n
+        self._reserve(stop)
+        for defaults in (self.FLOAT_DEFAULTS, self.INT_DEFAULTS, self.TENSOR_DEFAULTS):
+            for name, default in defaults.items():
+                self.columns[name][start:stop] = values.get(name, default)
+        self.count = stop
+        return start
+    
+    def clear(self):
+        """Drop every row, keeping the allocated columns for reuse."""
+        self.count = 0
+    
+    def swap_remove(self, index: int):
+        """Remove one row in O(1) by moving the last row into its slot.
+        
+        Columns stay dense, so kernels never need to skip dead rows; the
+        caller must re-point whatever referred to the last row.
+        """
+        last = self.count - 1
+        if index != last:
+            for column in self.columns.values():
+                column[index] = column[last]
+        self.count = last
+    
+    def copy_row(self, index: int) -> 'NodeArrays':
+        """Return a standalone single-row copy of one node."""
+        row = NodeArrays(1)
+        for name, column in self.columns.items():
+            row.columns[name][0] = column[index]
+        row.count = 1
+        return row
+
+def _live_column(name: str):
+    """Property exposing the live rows of one NodeArrays column.
+    
+    Assigning writes into the rows, so in-place updates like `arr.vx -= f`
+    work on the column.
+    """
+    def fget(self):
+        return self.columns[name][:self.count]
+    def fset(self, value):
+        self.columns[name][:self.count] = value
+    return property(fget, fset)
+
+for _name in (*NodeArrays.FLOAT_DEFAULTS, *NodeArrays.INT_DEFAULTS, *NodeArrays.TENSOR_DEFAULTS):
+    setattr(NodeArrays, _name, _live_column(_name))
+
+def _column(name: str):
+    """Property reading and writing one node's slot in a NodeArrays column."""
+    def fget(self):
+        return self._arr.columns[name].item(self._i)
+    def fset(self, value):
+        self._arr.columns[name][self._i] = value
+    return property(fget, fset)
+
+def _tensor_slot(name: str):
+    """Property exposing one node's slot of the tensors column as a 2-tuple."""
+    slot = NodeArrays.TENSOR_SLOTS.index(name)
+    def fget(self):
+        return tuple(self._arr.columns['tensors'][self._i, slot].tolist())
+    def fset(self, value):
+        self._arr.columns['tensors'][self._i, slot] = value
+    return property(fget, fset)
+
 class ConsciousnessNode:
     """
     Individual consciousness node implementing the Core EQ calculations.
     
+    A node is a view onto one row of the lattice's NodeArrays; reading or
+    writing an attribute goes straight to the underlying column.
+    
     Attributes:
         x, y: Spatial coordinates on consciousness manifold M_C
         frequency: Φ(x) - frequency signature (Hz, typically 40±5 for gamma)
@@ -46,199 +249,62 @@ class ConsciousnessNode:
         universe_id: Which universe this node belongs to
         resonance_coeff: λ_i for this universe
     """
-    x: float = 0.0
-    y: float = 0.0
-    vx: float = 0.0
-    vy: float = 0.0
-    radius: float = 3.0
-    base_radius: float = 3.0
+    __slots__ = ('_arr', '_i')
+    
+    def __init__(self, arr: NodeArrays, index: int):
+        self._arr = arr
+        self._i = index
+    
+    x = _column('x')
+    y = _column('y')
+    vx = _column('vx')
+    vy = _column('vy')
+    radius = _column('radius')
+    base_radius = _column('base_radius')
     
     # Core EQ Parameters
-    frequency: float = 40.0  # Φ(x): 40Hz gamma ± 5Hz noise
-    base_frequency: float = 40.0
-    phase: float = 0.0  # τ(x): random in [0, 2π)
-    attention: float = 0.0  # A(x): Gaussian attention density
+    frequency = _column('frequency')  # Φ(x): 40Hz gamma ± 5Hz noise
+    base_frequency = _column('base_frequency')
+    phase = _column('phase')  # τ(x): random in [0, 2π)
+    attention = _column('attention')  # A(x): Gaussian attention density
     
     # Complex consciousness value C = A*Φ*e^(iτ)
-    consciousness_re: float = 0.0  # Real part
-    consciousness_im: float = 0.0  # Imaginary part
+    consciousness_re = _column('consciousness_re')  # Real part
+    consciousness_im = _column('consciousness_im')  # Imaginary part
     
-    universe_id: int = 0
-    resonance_coeff: float = 1.0  # λ_i
+    universe_id = _column('universe_id')
+    universe_slot = _column('universe_slot')  # Index in its universe's node list
+    resonance_coeff = _column('resonance_coeff')  # λ_i
     
-    mass: float = 1.0
+    mass = _column('mass')
     
     # Intelligence tensor system (2D tensors)
-    logic_tensor: Tuple[float, float] = field(default_factory=lambda: (0.5, 0.5))
-    memory_tensor: Tuple[float, float] = field(default_factory=lambda: (0.5, 0.5))
-    processing_tensor: Tuple[float, float] = field(default_factory=lambda: (0.5, 0.5))
-    creativity_tensor: Tuple[float, float] = field(default_factory=lambda: (0.5, 0.5))
-    social_tensor: Tuple[float, float] = field(default_factory=lambda: (0.5, 0.5))
+    logic_tensor = _tensor_slot('logic')
+    memory_tensor = _tensor_slot('memory')
+    processing_tensor = _tensor_slot('processing')
+    creativity_tensor = _tensor_slot('creativity')
+    social_tensor = _tensor_slot('social')
     
     # Emergent properties
-    consciousness_depth: float = 0.0
-    self_awareness: float = 0.0
-    adaptive_capacity: float = 0.0
-    collective_intelligence: float = 0.0
+    consciousness_depth = _column('consciousness_depth')
+    self_awareness = _column('self_awareness')
+    adaptive_capacity = _column('adaptive_capacity')
+    collective_intelligence = _column('collective_intelligence')
     
-    cluster_id: int = -1
-    thought_intensity: float = 0.0
-    recursion_level: int = 0
-
-    def update(self, delta_time: float, params: Dict[str, float], mouse_influence: Optional[Dict] = None):
-        """Update consciousness node using Core EQ calculations."""
-        
-        # Apply time dilation
-        delta_time *= params.get('time_dilation', 1.0)
-        
-        # Calculate consciousness value: C = A(x) * Φ(x) * e^(iτ(x))
-        # e^(iτ) = cos(τ) + i*sin(τ)
-        cos_tau = np.cos(self.phase)
-        sin_tau = np.sin(self.phase)
-        
-        # C is complex: C = A(x) * Φ(x) * (cos(τ) + i*sin(τ))
-        self.consciousness_re = self.attention * self.frequency * cos_tau
-        self.consciousness_im = self.attention * self.frequency * sin_tau
-        
-        # Evolve phase based on frequency (simple evolution)
-        self.phase += self.frequency * delta_time * 2 * np.pi / 1000
-        self.phase = self.phase % (2 * np.pi)  # Keep in [0, 2π)
-        
-        # Apply mouse interaction if provided
-        if mouse_influence:
-            self._apply_mouse_interaction(mouse_influence, delta_time, params)
-        
-        # Apply gravity and physics
-        self._apply_physics(delta_time, params)
-        
-        # Update tensor system
-        self._update_intelligence_tensors(delta_time, params)
-        
-        # Update radius based on consciousness magnitude |C|
-        consciousness_magnitude = np.sqrt(self.consciousness_re**2 + self.consciousness_im**2)
-        self.radius = self.base_radius + consciousness_magnitude * 0.1
-
-    def _apply_mouse_interaction(self, mouse_influence: Dict, delta_time: float, params: Dict[str, float]):
-        """Apply mouse interaction forces based on mode."""
-        mouse_x = mouse_influence.get('x', 0)
-        mouse_y = mouse_influence.get('y', 0)
-        interaction_mode = mouse_influence.get('mode', 'push')
-        is_active = mouse_influence.get('active', False)
-        
-        if not is_active:
-            return
-            
-        dx_mouse = mouse_x - self.x
-        dy_mouse = mouse_y - self.y
-        distance_mouse = np.sqrt(dx_mouse**2 + dy_mouse**2)
-        max_distance = 200 * params.get('field_strength', 1.0)
-        
-        if distance_mouse < max_distance:
-            angle = np.arctan2(dy_mouse, dx_mouse)
-            force = (max_distance - distance_mouse) / max_distance
-            force *= params.get('field_strength', 1.0)
-            
-            if interaction_mode == 'push':
-                # Repel from mouse
-                self.vx -= np.cos(angle) * force * 0.4 * delta_time * 60
-                self.vy -= np.sin(angle) * force * 0.4 * delta_time * 60
-            elif interaction_mode == 'pull':
-                # Attract to mouse
-                self.vx += np.cos(angle) * force * 0.4 * delta_time * 60
-                self.vy += np.sin(angle) * force * 0.4 * delta_time * 60
-            elif interaction_mode == 'vortex':
-                # Create vortex effect
-                tangential_angle = angle + np.pi/2
-                self.vx += np.cos(tangential_angle) * force * 0.5 * delta_time * 60
-                self.vy += np.sin(tangential_angle) * force * 0.5 * delta_time * 60
-            elif interaction_mode == 'wave':
-                # Wave-like movement
-                time_factor = time.time() * 10
-                wave_force = np.sin(distance_mouse * 0.05 - time_factor) * force
-                self.vx += np.cos(angle) * wave_force * 0.5 * delta_time * 60
-                self.vy += np.sin(angle) * wave_force * 0.5 * delta_time * 60
-
-    def _apply_physics(self, delta_time: float, params: Dict[str, float]):
-        """Apply gravity, friction, and boundary conditions."""
-        
-        # Apply gravity (center attraction)
-        if params.get('gravity', 0) > 0:
-            dx = 0 - self.x
-            dy = 0 - self.y
-            dist_center = np.sqrt(dx**2 + dy**2)
-            if dist_center > 10:
-                gravity_force = params['gravity'] * 0.001 * delta_time * 60
-                self.vx += (dx / dist_center) * gravity_force
-                self.vy += (dy / dist_center) * gravity_force
-        
-        # Update position
-        self.x += self.vx * delta_time * 60
-        self.y += self.vy * delta_time * 60
-        
-        # Apply friction
-        friction = params.get('friction', 0.99) ** (delta_time * 60)
-        self.vx *= friction
-        self.vy *= friction
-        
-        # Boundary conditions with quantum tunneling
-        world_bounds_x = 1000  # Large world bounds
-        world_bounds_y = 1000
-        
-        if self.x < -world_bounds_x/2 or self.x > world_bounds_x/2:
-            if np.random.random() < 0.05:  # 5% quantum tunneling
-                self.x = world_bounds_x/2 if self.x < -world_bounds_x/2 else -world_bounds_x/2
-                # Reverse velocity to prevent immediate re-collision
-                self.vx *= -0.5
-            else:
-                self.vx *= -0.8 * params.get('elasticity', 0.8)
-                self.x = np.clip(self.x, -world_bounds_x/2, world_bounds_x/2)
-                
-        if self.y < -world_bounds_y/2 or self.y > world_bounds_y/2:
-            if np.random.random() < 0.05:
-                self.y = world_bounds_y/2 if self.y < -world_bounds_y/2 else -world_bounds_y/2
-                # Reverse velocity to prevent immediate re-collision
-                self.vy *= -0.5
-            else:
-                self.vy *= -0.8 * params.get('elasticity', 0.8)
-                self.y = np.clip(self.y, -world_bounds_y/2, world_bounds_y/2)
-
-    def _update_intelligence_tensors(self, delta_time: float, params: Dict[str, float]):
-        """Update 2D intelligence tensor system."""
-        evolution_rate = 0.02 * params.get('time_dilation', 1.0)
-        
-        # Simple tensor evolution with coupling
-        # Logic influences Memory
-        self.memory_tensor = (
-            self.memory_tensor[0] + self.logic_tensor[0] * evolution_rate * 0.1,
-            self.memory_tensor[1] + self.logic_tensor[1] * evolution_rate * 0.1
-        )
-        
-        # Memory influences Processing
-        self.processing_tensor = (
-            self.processing_tensor[0] + self.memory_tensor[0] * evolution_rate * 0.15,
-            self.processing_tensor[1] + self.memory_tensor[1] * evolution_rate * 0.15
-        )
-        
-        # Calculate emergent properties
-        logic_magnitude = np.sqrt(self.logic_tensor[0]**2 + self.logic_tensor[1]**2)
-        memory_magnitude = np.sqrt(self.memory_tensor[0]**2 + self.memory_tensor[1]**2)
-        processing_magnitude = np.sqrt(self.processing_tensor[0]**2 + self.processing_tensor[1]**2)
-        
-        self.consciousness_depth = min(1.0, (logic_magnitude + memory_magnitude + processing_magnitude) / 3)
-        self.self_awareness = min(1.0, logic_magnitude * 0.8 + self.thought_intensity * 0.2)
-        
-        # Decay thought intensity
-        self.thought_intensity = max(0, self.thought_intensity - delta_time * 0.5)
+    cluster_id = _column('cluster_id')
+    thought_intensity = _column('thought_intensity')
+    recursion_level = _column('recursion_level')
+    node_id = _column('node_id')  # Stable identifier for delta transmission
 
     def calculate_attention_density(self) -> float:
         """Calculate A(x) based on Gaussian distribution centered at (0,0)."""
-        sigma = 200.0  # Standard deviation for attention field
         d_sq = self.x**2 + self.y**2
-        return np.exp(-d_sq / (2 * sigma**2))
+        return math.exp(-d_sq / (2 * ATTENTION_SIGMA**2))
 
     def to_dict(self) -> Dict:
-        """Serialize node state for WebSocket transmission."""
+        """Serialize a single node (the lattice serializes whole frames column-wise)."""
         return {
+            'id': self.node_id,
             'x': self.x,
             'y': self.y,
             'radius': self.radius,
@@ -266,18 +332,6 @@ class Universe:
     resonance_coeff: float = 1.0  # λ_i
     nodes: List[ConsciousnessNode] = field(default_factory=list)
 
-    def update(self, time_factor: float):
-        """Update universe-specific effects on contained nodes."""
-        for node in self.nodes:
-            if self._contains_node(node):
-                # Apply universe-specific frequency modulation
-                node.frequency = node.base_frequency * (1 + self.resonance_coeff * 0.2 * np.sin(time_factor * 0.05))
-
-    def _contains_node(self, node: ConsciousnessNode) -> bool:
-        """Check if node is within this universe's boundary."""
-        dist = np.sqrt((node.x - self.center_x)**2 + (node.y - self.center_y)**2)
-        return dist < self.radius
-
     def to_dict(self) -> Dict:
         """Serialize universe state."""
         return {
@@ -297,200 +351,608 @@ class ConsciousnessLattice:
     and handles multiverse superposition with GPU optimization.
     """
     
-    def __init__(self, grid_size: int = 128, universe_count: int = 3):
+    def __init__(self, grid_size: int = 128, universe_count: int = 3, seed: Optional[int] = None):
         self.grid_size = grid_size
         self.universe_count = universe_count
-        self.time = 0.0
         
-        # Initialize nodes and universes
+        # Node state lives in SoA columns; self.nodes holds one view per row
+        self.arr = NodeArrays(grid_size)
         self.nodes: List[ConsciousnessNode] = []
         self.universes: List[Universe] = []
         self.clusters: List[Dict] = []
         
-        self.mouse_influence_queue: List[Dict] = []
+        self.mouse_influence_queue: deque = deque()
+        
+        # Physics parameters
+        self.params: Dict[str, float] = {}
+        
+        # Large lattices offload the all-pairs repulsion to the GPU
+        has_gpu = HAS_CUDA or (HAS_TORCH and torch.cuda.is_available())
+        use_gpu = grid_size >= GPU_MIN_NODES and has_gpu
+        self.device = 'cuda' if use_gpu else 'cpu'
+        
+        # Frames between full cluster rebuilds; centers are refreshed in between
+        self._cluster_rebuild_period = CLUSTER_REBUILD_PERIOD
+        
+        # Gaussian attention field exponent factor 1 / (2σ²)
+        self._inv2sigma2 = 1.0 / (2 * ATTENTION_SIGMA**2)
+        
+        # Preallocated scratch columns for the vectorized kernels
+        self._scratch: Dict[str, np.ndarray] = {}
+        
+        # get_state_binary output columns by (float format, field), reused across frames
+        self._binary_buffers: Dict[Tuple[str, str], np.ndarray] = {}
+        
+        # Every random draw (initial state and quantum tunneling) comes from one PCG64 generator
+        self.rng = np.random.default_rng(seed)
+        
+        # Frame counter bumped by every update(), so streams can tell frames apart
+        self.version = 0
+        
+        self.reset_in_place()
+        
+    def reset_in_place(self):
+        """Restart the simulation from a fresh random state, reusing this lattice's containers.
+
+        Callers holding a reference to the lattice keep seeing the live
+        simulation, unlike replacing the lattice object.
+        """
+        self.time = 0.0
+        self._next_node_id = 0
+        self._global_stats_cache: Optional[Dict[str, float]] = None
+        self._request_cluster_rebuild()
+        
+        self.arr.clear()
+        self.nodes.clear()
+        self.universes.clear()
+        self.clusters.clear()
+        self.mouse_influence_queue.clear()
         
         # Dirichlet-sampled λ weights for universes
-        self.lambdas = self._sample_dirichlet([1.0] * universe_count)
+        self.lambdas = self._sample_dirichlet([1.0] * self.universe_count)
         
-        # Physics parameters
-        self.params = {
+        self.params.clear()
+        self.params.update({
             'gravity': 1.0,
             'friction': 0.99,
             'elasticity': 0.8,
             'time_dilation': 1.0,
             'field_strength': 1.0
-        }
+        })
         
         # Initialize system
         self._initialize_universes()
         self._initialize_nodes()
-        self._normalize_attention_field()
+        self._compute_attention_vectorized()
         
         # Performance tracking
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
         
     def _sample_dirichlet(self, alpha: List[float]) -> List[float]:
         """Sample from Dirichlet distribution for universe weights λ."""
-        samples = [np.random.gamma(a, 1) for a in alpha]
-        total = sum(samples)
-        return [s / total for s in samples]
+        return self.rng.dirichlet(alpha).tolist()
+    
+    def _allocate_node_id(self) -> int:
+        """Return the next stable node identifier."""
+        node_id = self._next_node_id
+        self._next_node_id += 1
+        return node_id
     
     def _initialize_universes(self):
         """Create universes with sampled λ coefficients."""
-        self.universes = []
+        centers = self.rng.uniform(-400, 400, (self.universe_count, 2)).tolist()
+        radii = self.rng.uniform(150, 250, self.universe_count).tolist()
         for i in range(self.universe_count):
             universe = Universe(
                 id=i,
-                center_x=np.random.uniform(-400, 400),
-                center_y=np.random.uniform(-400, 400),
-                radius=np.random.uniform(150, 250),
+                center_x=centers[i][0],
+                center_y=centers[i][1],
+                radius=radii[i],
                 resonance_coeff=self.lambdas[i]
             )
             self.universes.append(universe)
     
     def _initialize_nodes(self):
         """Initialize consciousness nodes on the manifold."""
-        self.nodes = []
+        n = self.grid_size
+        
+        # Assign to random universes
+        universe_ids = self.rng.integers(0, self.universe_count, n)
         
-        for i in range(self.grid_size):
+        # Fill the columns in bulk with Core EQ parameters
+        start = self.arr.extend(
+            n,
             # Random placement within visible world
-            x = np.random.uniform(-500, 500)
-            y = np.random.uniform(-500, 500)
-            
-            # Assign to random universe
-            universe_id = np.random.randint(0, self.universe_count)
-            
-            # Create node with Core EQ parameters
-            node = ConsciousnessNode(
-                x=x, y=y,
-                frequency=40.0 + np.random.uniform(-5, 5),  # 40Hz ± 5Hz
-                phase=np.random.uniform(0, 2*np.pi),  # Random phase
-                universe_id=universe_id,
-                resonance_coeff=self.lambdas[universe_id]
-            )
-            
+            x=self.rng.uniform(-500, 500, n),
+            y=self.rng.uniform(-500, 500, n),
+            node_id=np.arange(self._next_node_id, self._next_node_id + n),
+            frequency=40.0 + self.rng.uniform(-5, 5, n),  # 40Hz ± 5Hz
+            phase=self.rng.uniform(0, 2*np.pi, n),  # Random phase
+            universe_id=universe_ids,
+            resonance_coeff=np.asarray(self.lambdas)[universe_ids],
             # Initialize intelligence tensors
-            node.logic_tensor = (np.random.random(), np.random.random())
-            node.memory_tensor = (np.random.random(), np.random.random())
-            node.processing_tensor = (np.random.random(), np.random.random())
-            node.creativity_tensor = (np.random.random(), np.random.random())
-            node.social_tensor = (np.random.random(), np.random.random())
-            
+            tensors=self.rng.random((n, len(NodeArrays.TENSOR_SLOTS), 2))
+        )
+        self._next_node_id += n
+        
+        for i in range(start, start + n):
+            node = ConsciousnessNode(self.arr, i)
             self.nodes.append(node)
-            self.universes[universe_id].nodes.append(node)
+            self._add_to_universe(node)
+    
+    def _add_to_universe(self, node: ConsciousnessNode):
+        """Append a node to its universe's list, recording its slot for O(1) removal."""
+        members = self.universes[node.universe_id].nodes
+        node.universe_slot = len(members)
+        members.append(node)
     
-    def _normalize_attention_field(self):
-        """Normalize attention field A(x) so ∫A(x)dμ(x) = 1."""
-        total_attention = 0.0
+    def _compute_attention_vectorized(self):
+        """Normalize attention field A(x) so ∫A(x)dμ(x) = 1.
         
-        # Calculate attention for each node
-        for node in self.nodes:
-            node.attention = node.calculate_attention_density()
-            total_attention += node.attention
+        Recomputes every node's unnormalized density from its current
+        position in one pass; add_node and remove_node only adjust the
+        running sum.
+        """
+        arr = self.arr
+        attention_raw = arr.attention_raw
+        np.square(arr.x, out=attention_raw)
+        attention_raw += np.square(arr.y, out=self._buffer('y_sq', len(arr)))
+        attention_raw *= -self._inv2sigma2
+        np.exp(attention_raw, out=attention_raw)
         
-        # Normalize
-        if total_attention > 0:
-            for node in self.nodes:
-                node.attention /= total_attention
+        self._attention_raw_sum = float(attention_raw.sum())
+        self._rescale_attention()
+    
+    def _rescale_attention(self):
+        """Set A(x) = raw density / running sum of raw densities."""
+        if self._attention_raw_sum > 0:
+            np.divide(self.arr.attention_raw, self._attention_raw_sum, out=self.arr.attention)
+        else:
+            self.arr.attention[:] = 0.0
     
     def update(self, delta_time: float, mouse_influence: Optional[Dict] = None):
         """Update the entire consciousness lattice."""
-        current_time = time.time()
+        # Monotonic, so a wall-clock step can never make delta time negative
+        current_time = time.monotonic()
         actual_delta_time = min(0.05, current_time - self.last_update_time)
         self.last_update_time = current_time
         
-        self.time += actual_delta_time * self.params['time_dilation']
+        params = PhysicsParams.from_dict(self.params)
+        self.time += actual_delta_time * params.time_dilation
+        self.version += 1
+        self._invalidate_global_stats()
         
-        # Process mouse influence from queue
-        current_mouse_influence = self.mouse_influence_queue.pop(0) if self.mouse_influence_queue else None
+        # Drain every queued mouse influence so events never back up across frames
+        mouse_influences = [mouse_influence] if mouse_influence else []
+        queue = self.mouse_influence_queue
+        while queue:
+            mouse_influences.append(queue.popleft())
 
         # Update universes
-        for universe in self.universes:
-            universe.update(self.time)
+        self._kernel_modulate_frequencies()
         
         # Update nodes with node-to-node interactions
-        self._update_nodes_with_interactions(actual_delta_time, current_mouse_influence)
+        self._update_nodes_with_interactions(actual_delta_time, params, mouse_influences)
         
-        # Update clusters and intelligence
-        self._update_clusters()
+        # Update clusters and intelligence; between full rebuilds nodes keep
+        # their cluster and only the centers follow the members
+        self._frames_since_cluster_rebuild += 1
+        if self._frames_since_cluster_rebuild >= self._cluster_rebuild_period:
+            self._update_clusters()
+            self._frames_since_cluster_rebuild = 0
+        else:
+            self._update_cluster_centers()
         
         # Calculate global consciousness value
         return self._calculate_global_consciousness()
     
-    def _update_nodes_with_interactions(self, delta_time: float, mouse_influence: Optional[Dict] = None):
+    def _kernel_modulate_frequencies(self):
+        """Φ = Φ0 * (1 + λ * 0.2 * sin(0.05 t)) for nodes inside their universe's boundary.
+        
+        Nodes carry their universe_id and λ, so each node's universe center and
+        radius are gathered from a small per-universe table and the whole
+        lattice is modulated in one pass. Nodes that drifted outside their
+        universe keep their current frequency.
+        """
+        arr = self.arr
+        n = arr.count
+        if n == 0 or not self.universes:
+            return
+        
+        bounds = np.array([(u.center_x, u.center_y, u.radius) for u in self.universes])
+        node_bounds = bounds[arr.universe_id]
+        dx = arr.x - node_bounds[:, 0]
+        dy = arr.y - node_bounds[:, 1]
+        inside = dx * dx + dy * dy < node_bounds[:, 2] * node_bounds[:, 2]
+        
+        modulation = 1.0 + arr.resonance_coeff * (0.2 * math.sin(self.time * 0.05))
+        np.multiply(arr.base_frequency, modulation, out=arr.frequency, where=inside)
+    
+    def _update_nodes_with_interactions(self, delta_time: float, params: PhysicsParams,
+                                        mouse_influences: Optional[List[Dict]] = None):
         """Update all nodes including mutual interactions."""
         
-        # Calculate all forces first
-        forces = []
-        for i, node in enumerate(self.nodes):
-            # Reset forces
-            repulsion_x = 0.0
-            repulsion_y = 0.0
+        # Calculate all forces first, then update nodes
+        self._apply_repulsion(delta_time, params)
+        
+        self._kernel_update_nodes(delta_time, params, mouse_influences)
+    
+    def _apply_repulsion(self, delta_time: float, params: PhysicsParams):
+        """Push overlapping nodes apart.
+        
+        For each pair closer than r_i + r_j + 10 the push is
+        (min_distance - distance) / min_distance along the unit vector
+        dx/distance, so no angles are needed; per unit of dx that is
+        1/distance - 1/min_distance, one reciprocal square root per pair. On a CUDA device the pairs are
+        evaluated by a tiled Numba CUDA kernel, or by PyTorch; with Numba, a
+        compiled kernel compares each node only with the nodes in neighbouring
+        spatial-hash cells; otherwise NumPy broadcasts cover all pairs, one
+        block of rows at a time.
+        """
+        arr = self.arr
+        n = arr.count
+        if n < 2:
+            return
+        
+        repulsion_strength = 0.5 * delta_time * 60 * params.elasticity
+        if self.device == 'cuda':
+            if HAS_CUDA:
+                compute_repulsion_cuda(arr.x, arr.y, arr.radius, arr.vx, arr.vy, repulsion_strength)
+            else:
+                self._apply_repulsion_torch(repulsion_strength)
+            return
+        if HAS_NUMBA:
+            spatial_hash = self._build_spatial_hash(2 * float(arr.radius.max()) + 10)
+            compute_repulsion(arr.x, arr.y, arr.radius, arr.vx, arr.vy, repulsion_strength, *spatial_hash)
+            return
+        
+        x, y, radius = arr.x, arr.y, arr.radius
+        push_x = self._buffer('push_x', n)
+        push_y = self._buffer('push_y', n)
+        # Row blocks of REPULSION_BLOCK_ROWS × n pairs keep the temporaries cache-sized
+        for start in range(0, n, REPULSION_BLOCK_ROWS):
+            rows = slice(start, start + REPULSION_BLOCK_ROWS)
+            block = len(x[rows])
+            dx = np.subtract(x[None, :], x[rows, None], out=self._pair_buffer('dx', block, n))
+            dy = np.subtract(y[None, :], y[rows, None], out=self._pair_buffer('dy', block, n))
+            distance_sq = np.multiply(dx, dx, out=self._pair_buffer('distance_sq', block, n))
+            distance_sq += np.square(dy, out=self._pair_buffer('scale', block, n))
+            min_distance = np.add(radius[rows, None], radius[None, :],
+                                  out=self._pair_buffer('min_distance', block, n))
+            min_distance += 10
             
-            # Calculate repulsion from other nodes
-            for j, other_node in enumerate(self.nodes):
-                if i == j:
-                    continue
-                    
-                dx = other_node.x - node.x
-                dy = other_node.y - node.y
-                distance = np.sqrt(dx**2 + dy**2)
-                min_distance = node.radius + other_node.radius + 10
-                
-                if distance < min_distance and distance > 0:
-                    force = (min_distance - distance) / min_distance
-                    angle = np.arctan2(dy, dx)
-                    repulsion_strength = 0.5 * delta_time * 60 * self.params['elasticity']
-                    repulsion_x -= np.cos(angle) * force * repulsion_strength
-                    repulsion_y -= np.sin(angle) * force * repulsion_strength
+            # Overlapping pairs only; a node's distance to itself is 0
+            active = np.less(distance_sq, np.square(min_distance, out=self._pair_buffer('scale', block, n)),
+                             out=self._pair_buffer('active', block, n, dtype=bool))
+            active &= distance_sq > 0
             
-            forces.append({'x': repulsion_x, 'y': repulsion_y})
-
-        # Then apply forces and update nodes
-        for i, node in enumerate(self.nodes):
-            # Apply repulsion
-            node.vx += forces[i]['x']
-            node.vy += forces[i]['y']
+            # force / distance = 1/distance - 1/min_distance, zero for inactive pairs
+            scale = np.sqrt(distance_sq, out=self._pair_buffer('scale', block, n))
+            np.reciprocal(scale, out=scale, where=active)
+            scale -= np.reciprocal(min_distance, out=min_distance)
+            scale *= active
             
-            # Update node
-            node.update(delta_time, self.params, mouse_influence)
+            np.einsum('ij,ij->i', dx, scale, out=push_x[rows])
+            np.einsum('ij,ij->i', dy, scale, out=push_y[rows])
+        
+        arr.vx -= push_x * repulsion_strength
+        arr.vy -= push_y * repulsion_strength
+    
+    def _apply_repulsion_torch(self, repulsion_strength: float):
+        """All-pairs repulsion on self.device; same force law as the NumPy path."""
+        arr = self.arr
+        positions = np.stack((arr.x, arr.y, arr.radius))
+        x, y, radius = torch.from_numpy(positions).to(self.device, dtype=torch.float32)
+        
+        dx = x.unsqueeze(0) - x.unsqueeze(1)
+        dy = y.unsqueeze(0) - y.unsqueeze(1)
+        distance_sq = dx * dx + dy * dy
+        min_distance = radius.unsqueeze(0) + radius.unsqueeze(1) + 10
+        
+        # force / distance, zero for non-overlapping pairs and the diagonal
+        active = (distance_sq < min_distance * min_distance) & (distance_sq > 0)
+        scale = torch.rsqrt(distance_sq.clamp_min(1e-12)) - 1.0 / min_distance
+        scale = torch.where(active, scale, torch.zeros_like(scale))
+        
+        push = torch.stack(((dx * scale).sum(dim=1), (dy * scale).sum(dim=1))).cpu().numpy()
+        arr.vx -= push[0] * repulsion_strength
+        arr.vy -= push[1] * repulsion_strength
+    
+    def _kernel_apply_mouse_interactions(self, mouse_influences: List[Dict], delta_time: float,
+                                         params: PhysicsParams):
+        """Superpose several mouse influences onto every node's velocity.
+        
+        Mouse forces depend only on positions, which do not change while
+        they are applied, so applying them in turn sums their effects.
+        """
+        for mouse_influence in mouse_influences:
+            self._kernel_apply_mouse_interaction(mouse_influence, delta_time, params)
+    
+    def _kernel_apply_mouse_interaction(self, mouse_influence: Dict, delta_time: float, params: PhysicsParams):
+        """Apply mouse interaction forces to every node based on mode.
+        
+        Forces act along the unit vector (dx, dy) / distance toward the
+        mouse; the vortex tangent is its perpendicular (-uy, ux).
+        """
+        if not mouse_influence.get('active', False):
+            return
+        
+        field_strength = params.field_strength
+        max_distance = 200 * field_strength
+        if max_distance <= 0:
+            return
+        
+        arr = self.arr
+        n = arr.count
+        dx_mouse = np.subtract(mouse_influence.get('x', 0), arr.x, out=self._buffer('dx_mouse', n))
+        dy_mouse = np.subtract(mouse_influence.get('y', 0), arr.y, out=self._buffer('dy_mouse', n))
+        distance_mouse = np.hypot(dx_mouse, dy_mouse, out=self._buffer('distance_mouse', n))
+        
+        # Unit vector toward the mouse; a node exactly under it is pushed along +x
+        ux = np.ones(n, dtype=DTYPE)
+        uy = np.zeros(n, dtype=DTYPE)
+        np.divide(dx_mouse, distance_mouse, out=ux, where=distance_mouse > 0)
+        np.divide(dy_mouse, distance_mouse, out=uy, where=distance_mouse > 0)
+        
+        # Linear falloff inside max_distance, zero outside
+        force = (max_distance - distance_mouse) / max_distance
+        force *= field_strength
+        force *= distance_mouse < max_distance
+        
+        interaction_mode = mouse_influence.get('mode', 'push')
+        if interaction_mode == 'push':
+            # Repel from mouse
+            force *= 0.4 * delta_time * 60
+            arr.vx -= ux * force
+            arr.vy -= uy * force
+        elif interaction_mode == 'pull':
+            # Attract to mouse
+            force *= 0.4 * delta_time * 60
+            arr.vx += ux * force
+            arr.vy += uy * force
+        elif interaction_mode == 'vortex':
+            # Create vortex effect
+            force *= 0.5 * delta_time * 60
+            arr.vx -= uy * force
+            arr.vy += ux * force
+        elif interaction_mode == 'wave':
+            # Wave-like movement
+            # Reduced in double precision; float32 cannot resolve time.time() * 10
+            time_factor = (time.time() * 10) % (2 * np.pi)
+            force *= np.sin(distance_mouse * 0.05 - time_factor)
+            force *= 0.5 * delta_time * 60
+            arr.vx += ux * force
+            arr.vy += uy * force
+    
+    def _kernel_update_intelligence_tensors(self, delta_time: float, params: PhysicsParams):
+        """Update the 2D intelligence tensor system of every node."""
+        arr = self.arr
+        tensors = arr.tensors
+        evolution_rate = 0.02 * params.time_dilation
+        
+        # Simple tensor evolution with coupling
+        # Logic influences Memory, then (updated) Memory influences Processing
+        tensors[:, 1] += tensors[:, 0] * (evolution_rate * 0.1)
+        tensors[:, 2] += tensors[:, 1] * (evolution_rate * 0.15)
+        
+        # Calculate emergent properties from logic/memory/processing magnitudes
+        magnitudes = np.hypot(tensors[:, :3, 0], tensors[:, :3, 1])
+        np.minimum(magnitudes.sum(axis=1) / 3, 1.0, out=arr.consciousness_depth)
+        np.minimum(magnitudes[:, 0] * 0.8 + arr.thought_intensity * 0.2, 1.0, out=arr.self_awareness)
+        
+        # Decay thought intensity
+        thought_intensity = arr.thought_intensity
+        thought_intensity -= delta_time * 0.5
+        np.maximum(thought_intensity, 0, out=thought_intensity)
+    
+    def _kernel_apply_physics(self, delta_time: float, params: PhysicsParams):
+        """Apply gravity, friction, and boundary conditions to every node."""
+        arr = self.arr
+        n = arr.count
+        x, y, vx, vy = arr.x, arr.y, arr.vx, arr.vy
+        
+        # Apply gravity (center attraction) to nodes further than 10 from it
+        gravity = params.gravity
+        if gravity > 0:
+            dist_center = np.hypot(x, y, out=self._buffer('dist_center', n))
+            pull = np.zeros_like(dist_center)
+            np.divide(gravity * 0.001 * delta_time * 60, dist_center, out=pull, where=dist_center > 10)
+            vx -= x * pull
+            vy -= y * pull
+        
+        # Update position
+        x += vx * (delta_time * 60)
+        y += vy * (delta_time * 60)
+        
+        # Apply friction
+        friction = params.friction ** (delta_time * 60)
+        vx *= friction
+        vy *= friction
+        
+        # Boundary conditions with quantum tunneling
+        elasticity = params.elasticity
+        tunnel_draws = self.rng.random((2, n))
+        self._apply_boundary(x, vx, WORLD_BOUNDS / 2, elasticity, tunnel_draws[0])
+        self._apply_boundary(y, vy, WORLD_BOUNDS / 2, elasticity, tunnel_draws[1])
+    
+    def _apply_boundary(self, position: np.ndarray, velocity: np.ndarray, half_bounds: float,
+                        elasticity: float, tunnel_draws: np.ndarray):
+        """Bounce or tunnel nodes that left [-half_bounds, half_bounds] on one axis.
+        
+        Escaped nodes tunnel to the opposite edge with 5% probability
+        (velocity reversed and halved), decided by `tunnel_draws` in [0, 1);
+        the rest are clamped to the edge and bounce inelastically. Computed
+        with masks, no per-node branches.
+        """
+        outside = np.abs(position) > half_bounds
+        tunnel = outside & (tunnel_draws < 0.05)
+        
+        tunnel_position = np.copysign(half_bounds, -position)
+        np.clip(position, -half_bounds, half_bounds, out=position)
+        np.copyto(position, tunnel_position, where=tunnel)
+        
+        factor = np.where(outside, -0.8 * elasticity, 1.0)
+        factor[tunnel] = -0.5
+        velocity *= factor
+    
+    def _build_spatial_hash(self, min_cell_size: float = 0.0):
+        """Bucket node positions into cells covering every interaction cutoff.
+        
+        The cell size is the larger of the cluster threshold (80) and
+        min_cell_size, so scanning the 3×3 neighbouring cells finds every
+        interacting pair.
+        """
+        return build_spatial_hash(self.arr.x, self.arr.y, max(CLUSTER_DISTANCE, min_cell_size))
+    
+    def _pair_buffer(self, name: str, rows: int, n: int, dtype=DTYPE) -> np.ndarray:
+        """Return a reusable (rows, n) scratch array for one block of the pairwise kernels."""
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.shape[1] != n or len(buffer) < rows:
+            buffer = np.empty((max(rows, REPULSION_BLOCK_ROWS), n), dtype=dtype)
+            self._scratch[name] = buffer
+        return buffer[:rows]
+    
+    def _buffer(self, name: str, n: int) -> np.ndarray:
+        """Return a reusable scratch array of length n."""
+        buffer = self._scratch.get(name)
+        if buffer is None or len(buffer) < n:
+            buffer = np.empty(max(n, self.arr.capacity), dtype=DTYPE)
+            self._scratch[name] = buffer
+        return buffer[:n]
+    
+    def _binary_buffer(self, float_format: str, key: str, dtype: str, n: int) -> np.ndarray:
+        """Return the reusable length-n output column for one get_state_binary format and field."""
+        buffer = self._binary_buffers.get((float_format, key))
+        if buffer is None or len(buffer) < n:
+            buffer = np.empty(max(n, self.arr.capacity), dtype=dtype)
+            self._binary_buffers[(float_format, key)] = buffer
+        return buffer[:n]
+    
+    def _kernel_update_nodes(self, delta_time: float, params: PhysicsParams,
+                             mouse_influences: Optional[List[Dict]] = None):
+        """Update every node using Core EQ calculations, one array op at a time."""
+        # Apply time dilation
+        delta_time *= params.time_dilation
+        
+        # Consciousness, phase and radius depend only on each node's own row
+        self._kernel_advance_consciousness(delta_time)
+        
+        # Apply this frame's mouse interactions, if any
+        if mouse_influences:
+            self._kernel_apply_mouse_interactions(mouse_influences, delta_time, params)
+        
+        if HAS_NUMBA:
+            # Physics and tensors touch disjoint columns: one compiled pass
+            self._kernel_step_nodes_compiled(delta_time, params)
+            return
+        
+        # Apply gravity and physics
+        self._kernel_apply_physics(delta_time, params)
+        
+        # Update tensor system
+        self._kernel_update_intelligence_tensors(delta_time, params)
+    
+    def _kernel_step_nodes_compiled(self, delta_time: float, params: PhysicsParams):
+        """Apply physics and evolve the intelligence tensors with the fused Numba kernel."""
+        arr = self.arr
+        tunnel_draws = self.rng.random((2, arr.count))
+        step_nodes(arr.x, arr.y, arr.vx, arr.vy, tunnel_draws[0], tunnel_draws[1], arr.tensors,
+                   arr.consciousness_depth, arr.self_awareness, arr.thought_intensity,
+                   delta_time, params.gravity, params.friction ** (delta_time * 60),
+                   params.elasticity, WORLD_BOUNDS / 2, 0.02 * params.time_dilation)
+    
+    def _kernel_advance_consciousness(self, delta_time: float):
+        """Compute C, evolve the phase and set the radius from |C| for every node.
+        
+        With Numba this is a single fused pass; otherwise one array op at a time.
+        """
+        arr = self.arr
+        n = arr.count
+        phase_step = delta_time * 2 * np.pi / 1000
+        if HAS_NUMBA:
+            advance_consciousness(arr.phase, arr.frequency, arr.attention, arr.base_radius,
+                                  arr.consciousness_re, arr.consciousness_im, arr.radius, phase_step)
+            return
+        
+        # Calculate consciousness value: C = A(x) * Φ(x) * e^(iτ(x))
+        # e^(iτ) = cos(τ) + i*sin(τ)
+        phase = arr.phase
+        cos_tau = np.cos(phase, out=self._buffer('cos_tau', n))
+        sin_tau = np.sin(phase, out=self._buffer('sin_tau', n))
+        
+        # C is complex: C = A(x) * Φ(x) * (cos(τ) + i*sin(τ))
+        amplitude = np.multiply(arr.attention, arr.frequency, out=self._buffer('amplitude', n))
+        np.multiply(amplitude, cos_tau, out=arr.consciousness_re)
+        np.multiply(amplitude, sin_tau, out=arr.consciousness_im)
+        
+        # Evolve phase based on frequency (simple evolution), kept in [0, 2π)
+        phase += np.multiply(arr.frequency, phase_step, out=self._buffer('phase_step', n))
+        np.remainder(phase, 2 * np.pi, out=phase)
+        
+        # Update radius based on consciousness magnitude |C| = |A(x) * Φ(x)|, as |e^(iτ)| = 1
+        radius = arr.radius
+        np.abs(amplitude, out=radius)
+        radius *= 0.1
+        radius += arr.base_radius
     
     def _update_clusters(self):
         """Detect and update consciousness clusters."""
+        if HAS_NUMBA:
+            self._update_clusters_compiled()
+            return
+        if HAS_SCIPY:
+            self._update_clusters_kdtree()
+            return
+        
         # Reset cluster assignments
         for node in self.nodes:
             node.cluster_id = -1
         
         self.clusters = []
-        processed = set()
+        # processed[i] is 1 once node i has joined a cluster
+        processed = bytearray(len(self.nodes))
+        if not self.nodes:
+            return
+        
+        cluster_thresh_sq = CLUSTER_DISTANCE * CLUSTER_DISTANCE
+        
+        # Candidates come from the 3×3 block of hash cells around a node
+        spatial_hash = self._build_spatial_hash()
+        cell_x = spatial_hash.cell_x.tolist()
+        cell_y = spatial_hash.cell_y.tolist()
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for j in range(len(self.nodes)):
+            buckets.setdefault((cell_x[j], cell_y[j]), []).append(j)
         
         # Build clusters based on proximity and phase/frequency alignment
         for i, node in enumerate(self.nodes):
-            if i in processed:
+            if processed[i]:
                 continue
                 
             cluster_nodes = [node]
-            processed.add(i)
-            queue = [i]
-            safety_counter = 0  # Prevent infinite loops
-            max_iterations = len(self.nodes) * 2  # Safety limit
+            processed[i] = 1
+            # Each node is queued at most once (guarded by processed)
+            queue = deque([i])
             
-            while queue and safety_counter < max_iterations:
-                safety_counter += 1
-                current_idx = queue.pop(0)
+            while queue:
+                current_idx = queue.popleft()
                 current_node = self.nodes[current_idx]
+                cx = cell_x[current_idx]
+                cy = cell_y[current_idx]
+                neighbours = [j for ox in (-1, 0, 1) for oy in (-1, 0, 1)
+                              for j in buckets.get((cx + ox, cy + oy), ())]
                 
-                for j, candidate in enumerate(self.nodes):
-                    if j in processed:
+                for j in sorted(neighbours):
+                    if processed[j]:
                         continue
-                        
+                    candidate = self.nodes[j]
+                    
                     dx = candidate.x - current_node.x
                     dy = candidate.y - current_node.y
-                    distance = np.sqrt(dx**2 + dy**2)
                     
-                    if distance < 80:  # Cluster proximity threshold
+                    if dx * dx + dy * dy < cluster_thresh_sq:  # Cluster proximity threshold
                         # Check phase compatibility
-                        phase_diff = abs(np.sin(current_node.phase - candidate.phase))
+                        phase_diff = abs(math.sin(current_node.phase - candidate.phase))
                         phase_compatible = phase_diff < 0.5
                         
                         # Check frequency compatibility
@@ -500,7 +962,7 @@ class ConsciousnessLattice:
                         if phase_compatible and freq_compatible:
                             cluster_nodes.append(candidate)
                             queue.append(j)
-                            processed.add(j)
+                            processed[j] = 1
             
             # Create cluster if significant
             if len(cluster_nodes) >= 3:
@@ -508,8 +970,8 @@ class ConsciousnessLattice:
                 cluster = {
                     'id': cluster_id,
                     'nodes': cluster_nodes,
-                    'center_x': sum(n.x for n in cluster_nodes) / len(cluster_nodes),
-                    'center_y': sum(n.y for n in cluster_nodes) / len(cluster_nodes),
+                    'center_x': 0.0,
+                    'center_y': 0.0,
                     'recursion_depth': 0,
                     'complexity_score': 0
                 }
@@ -519,24 +981,148 @@ class ConsciousnessLattice:
                     node.cluster_id = cluster_id
                 
                 self.clusters.append(cluster)
+        
+        # All centroids in one bincount pass over the cluster_id column
+        self._update_cluster_centers()
+    
+    def _request_cluster_rebuild(self):
+        """Make the next update() run full cluster detection."""
+        self._frames_since_cluster_rebuild = self._cluster_rebuild_period
+    
+    def _update_cluster_centers(self):
+        """Set each cluster's center to the current mean position of its members.
+        
+        One bincount per axis over the cluster_id column covers every cluster.
+        """
+        if not self.clusters:
+            return
+        arr = self.arr
+        cluster_id = arr.cluster_id
+        member = cluster_id >= 0
+        ids = cluster_id[member]
+        count = len(self.clusters)
+        sizes = np.bincount(ids, minlength=count)
+        sum_x = np.bincount(ids, weights=arr.x[member], minlength=count)
+        sum_y = np.bincount(ids, weights=arr.y[member], minlength=count)
+        
+        for cluster, size, x, y in zip(self.clusters, sizes.tolist(), sum_x.tolist(), sum_y.tolist()):
+            if size:
+                cluster['center_x'] = x / size
+                cluster['center_y'] = y / size
+    
+    def _update_clusters_kdtree(self):
+        """Detect clusters from KD-tree neighbour pairs and union-find labelling.
+        
+        A cluster is a connected component of the graph whose edges are the
+        compatible pairs, so this finds the same clusters, in the same order,
+        as the breadth-first search.
+        """
+        arr = self.arr
+        n = arr.count
+        arr.cluster_id[:] = -1
+        self.clusters = []
+        if n == 0:
+            return
+        
+        x, y, phase, frequency = arr.x, arr.y, arr.phase, arr.frequency
+        tree = cKDTree(np.column_stack((x, y)))
+        pairs = tree.query_pairs(CLUSTER_DISTANCE, output_type='ndarray')
+        a, b = pairs[:, 0], pairs[:, 1]
+        
+        # Proximity (strict), phase and frequency compatibility as one mask
+        dx = x[b] - x[a]
+        dy = y[b] - y[a]
+        keep = dx * dx + dy * dy < CLUSTER_DISTANCE * CLUSTER_DISTANCE
+        keep &= np.abs(np.sin(phase[a] - phase[b])) < 0.5
+        low = np.minimum(frequency[a], frequency[b])
+        high = np.maximum(np.maximum(frequency[a], frequency[b]), 0.001)
+        keep &= low / high > 0.7
+        
+        # Labels are the smallest member index, so sorting by label keeps the BFS cluster order
+        labels = union_find_labels(n, a[keep], b[keep])
+        order = np.argsort(labels, kind='stable')
+        sizes = np.bincount(labels, minlength=n)
+        
+        start = 0
+        for label in np.flatnonzero(sizes).tolist():
+            size = int(sizes[label])
+            members = order[start:start + size]
+            start += size
+            
+            # Create cluster if significant
+            if size >= 3:
+                cluster_id = len(self.clusters)
+                arr.cluster_id[members] = cluster_id
+                self.clusters.append({
+                    'id': cluster_id,
+                    'nodes': [self.nodes[i] for i in members.tolist()],
+                    'center_x': 0.0,
+                    'center_y': 0.0,
+                    'recursion_depth': 0,
+                    'complexity_score': 0
+                })
+        
+        self._update_cluster_centers()
+    
+    def _update_clusters_compiled(self):
+        """Detect clusters with the compiled BFS kernel."""
+        arr = self.arr
+        n = arr.count
+        arr.cluster_id[:] = -1
+        self.clusters = []
+        if n == 0:
+            return
+        
+        order = np.empty(n, dtype=np.int64)
+        starts = np.empty(n + 1, dtype=np.int64)
+        component_count = cluster_bfs(arr.x, arr.y, arr.phase, arr.frequency, CLUSTER_DISTANCE**2,
+                                      *self._build_spatial_hash(), order, starts)
+        
+        for k in range(component_count):
+            members = order[starts[k]:starts[k + 1]]
+            
+            # Create cluster if significant
+            if len(members) >= 3:
+                cluster_id = len(self.clusters)
+                arr.cluster_id[members] = cluster_id
+                self.clusters.append({
+                    'id': cluster_id,
+                    'nodes': [self.nodes[i] for i in members.tolist()],
+                    'center_x': 0.0,
+                    'center_y': 0.0,
+                    'recursion_depth': 0,
+                    'complexity_score': 0
+                })
+        
+        self._update_cluster_centers()
+    
+    def _invalidate_global_stats(self):
+        """Drop the cached global stats after the nodes have changed."""
+        self._global_stats_cache = None
     
     def _calculate_global_consciousness(self) -> Dict[str, float]:
+        """Return the global consciousness stats, computed at most once per change.
+
+        Servers read the stats several times per tick (the update result,
+        state frames, /api/stats); only the first read walks the nodes.
+        The returned dict is shared and must not be mutated.
+        """
+        if self._global_stats_cache is None:
+            self._global_stats_cache = self._compute_global_consciousness()
+        return self._global_stats_cache
+    
+    def _compute_global_consciousness(self) -> Dict[str, float]:
         """Calculate global consciousness integral C = ∫A(x)Φ(x)e^(iτ(x))dμ(x)."""
-        total_consciousness_re = 0.0
-        total_consciousness_im = 0.0
-        total_attention = 0.0
-        total_phase = 0.0
+        arr = self.arr
         
-        for node in self.nodes:
-            # Weight by universe λ coefficient
-            lambda_weight = self.lambdas[node.universe_id]
-            total_consciousness_re += node.consciousness_re * lambda_weight
-            total_consciousness_im += node.consciousness_im * lambda_weight
-            total_attention += node.attention
-            total_phase += node.phase
+        # Weight by universe λ coefficient; resonance_coeff holds lambdas[universe_id]
+        total_consciousness_re = float(arr.consciousness_re @ arr.resonance_coeff)
+        total_consciousness_im = float(arr.consciousness_im @ arr.resonance_coeff)
+        total_attention = float(arr.attention.sum())
+        total_phase = float(arr.phase.sum())
         
         # Calculate magnitude |C|
-        consciousness_magnitude = np.sqrt(total_consciousness_re**2 + total_consciousness_im**2)
+        consciousness_magnitude = math.hypot(total_consciousness_re, total_consciousness_im)
         
         return {
             'consciousness_magnitude': consciousness_magnitude,
@@ -550,61 +1136,93 @@ class ConsciousnessLattice:
     
     def add_node(self, x: float, y: float) -> ConsciousnessNode:
         """Add a new consciousness node at specified coordinates."""
-        universe_id = np.random.randint(0, self.universe_count)
+        universe_id = self.rng.integers(0, self.universe_count)
         
-        node = ConsciousnessNode(
+        index = self.arr.extend(
+            1,
             x=x, y=y,
-            frequency=40.0 + np.random.uniform(-5, 5),
-            phase=np.random.uniform(0, 2*np.pi),
+            node_id=self._allocate_node_id(),
+            frequency=40.0 + self.rng.uniform(-5, 5),
+            phase=self.rng.uniform(0, 2*np.pi),
             universe_id=universe_id,
             resonance_coeff=self.lambdas[universe_id]
         )
+        node = ConsciousnessNode(self.arr, index)
         
         # Calculate attention based on Gaussian model
-        node.attention = node.calculate_attention_density()
+        raw_attention = node.calculate_attention_density()
+        self.arr.attention_raw[index] = raw_attention
         
         self.nodes.append(node)
-        self.universes[universe_id].nodes.append(node)
+        self._add_to_universe(node)
         
         # Re-normalize attention field to maintain ∫A(x)dμ(x) = 1
-        self._normalize_attention_field()
+        self._attention_raw_sum += raw_attention
+        self._rescale_attention()
+        
+        self._request_cluster_rebuild()
+        self._invalidate_global_stats()
         
         return node
     
     def remove_node(self, node: ConsciousnessNode):
         """Safely remove a node from both main list and universe list."""
-        if node in self.nodes:
-            self.nodes.remove(node)
+        if node._arr is not self.arr or self.nodes[node._i] is not node:
+            return
         
-        # Remove from universe nodes list to prevent stale references
+        # Remove from the universe's list the same way: the universe's last
+        # node takes this one's slot
         if node.universe_id < len(self.universes):
-            universe = self.universes[node.universe_id]
-            if node in universe.nodes:
-                universe.nodes.remove(node)
+            members = self.universes[node.universe_id].nodes
+            slot = node.universe_slot
+            if slot < len(members) and members[slot] is node:
+                last_member = members.pop()
+                if last_member is not node:
+                    last_member.universe_slot = slot
+                    members[slot] = last_member
         
-        # Re-normalize attention field after removal
-        self._normalize_attention_field()
+        # Detach the node onto a private copy of its row, then fill the gap
+        # with the last node so no other row moves
+        index = node._i
+        self._attention_raw_sum -= self.arr.attention_raw[index]
+        node._arr = self.arr.copy_row(index)
+        node._i = 0
+        self.arr.swap_remove(index)
+        last = self.nodes.pop()
+        if last is not node:
+            last._i = index
+            self.nodes[index] = last
+        
+        # Re-normalize attention field after removal; rebuild the sum if it
+        # has cancelled down to rounding noise
+        if not self.nodes or self._attention_raw_sum <= 1e-9:
+            self._compute_attention_vectorized()
+        else:
+            self._rescale_attention()
+        self._request_cluster_rebuild()
+        self._invalidate_global_stats()
     
     def quantum_collapse(self, x: float, y: float):
         """Trigger quantum collapse effect at specified location."""
-        for node in self.nodes:
-            dx = node.x - x
-            dy = node.y - y
-            distance = np.sqrt(dx**2 + dy**2)
-            
-            if distance < 200:  # Collapse radius
-                # Reset consciousness and add random phase shift
-                node.consciousness_re = 0
-                node.consciousness_im = 0
-                node.phase += np.pi
-                node.phase = node.phase % (2 * np.pi)
-                
-                # Add outward force
-                if distance > 0:
-                    angle = np.arctan2(dy, dx)
-                    push_force = (200 - distance) / 200 * 5
-                    node.vx += np.cos(angle) * push_force
-                    node.vy += np.sin(angle) * push_force
+        arr = self.arr
+        dx = arr.x - x
+        dy = arr.y - y
+        distance = np.hypot(dx, dy)
+        
+        collapsed = distance < 200  # Collapse radius
+        
+        # Reset consciousness and add random phase shift
+        arr.consciousness_re[collapsed] = 0
+        arr.consciousness_im[collapsed] = 0
+        arr.phase[collapsed] = (arr.phase[collapsed] + np.pi) % (2 * np.pi)
+        
+        # Add outward force along the unit vector away from the collapse point
+        pushed = collapsed & (distance > 0)
+        push_scale = (200 - distance[pushed]) / 200 * 5 / distance[pushed]
+        arr.vx[pushed] += dx[pushed] * push_scale
+        arr.vy[pushed] += dy[pushed] * push_scale
+        
+        self._invalidate_global_stats()
     
     def set_mode(self, mode: UniverseMode):
         """Set visualization mode (affects frontend rendering)."""
@@ -614,9 +1232,9 @@ class ConsciousnessLattice:
     def get_state_for_transmission(self) -> Dict:
         """Get complete lattice state for WebSocket transmission."""
         return {
-            'nodes': [node.to_dict() for node in self.nodes],
+            'nodes': self._serialize_nodes(),
             'universes': [universe.to_dict() for universe in self.universes],
-            'clusters': self.clusters,
+            'clusters': [self._serialize_cluster(cluster) for cluster in self.clusters],
             'global_stats': self._calculate_global_consciousness(),
             'mode': getattr(self, 'current_mode', UniverseMode.CONSCIOUSNESS).value,
             'params': self.params,
@@ -624,6 +1242,82 @@ class ConsciousnessLattice:
             'time': self.time
         }
     
+    def get_node_columns(self) -> Dict[str, list]:
+        """Get node state column-wise: one list per wire field, in node order."""
+        columns = self.arr.columns
+        count = len(self.arr)
+        return {key: columns[name][:count].tolist() for key, name in NODE_WIRE_FIELDS}
+    
+    def get_state_binary(self, float_format: str = 'f4') -> Dict:
+        """Get node state as packed little-endian column buffers for binary transports.
+        
+        Float fields are sent in float_format (see BINARY_FLOAT_FORMATS) and
+        integer fields as int32 ('i4'); each entry in 'columns' holds `n`
+        values of its field. 'float_fields' and 'int_fields' list the keys of
+        each kind in wire order. For 'u1', 'ranges' maps each float field to
+        its (lo, hi) and a byte q decodes to lo + q * (hi - lo) / 255.
+        
+        The columns are memoryviews of output buffers reused across calls.
+        Every buffer, int columns included, is kept per float format, so the
+        views hold this frame only until the next call with the same format;
+        encode them (or copy them) before then.
+        """
+        if float_format not in BINARY_FLOAT_FORMATS:
+            raise ValueError(f"Unknown float format {float_format!r}")
+        
+        columns = self.arr.columns
+        count = len(self.arr)
+        packed = {}
+        ranges = {}
+        float_fields = []
+        int_fields = []
+        for key, name in NODE_WIRE_FIELDS:
+            column = columns[name][:count]
+            if column.dtype.kind != 'f':
+                out = self._binary_buffer(float_format, key, '<i4', count)
+                out[...] = column
+                packed[key] = out.data
+                int_fields.append(key)
+                continue
+            
+            float_fields.append(key)
+            out = self._binary_buffer(float_format, key, '<' + float_format, count)
+            if float_format == 'u1':
+                lo, hi = (float(column.min()), float(column.max())) if count else (0.0, 0.0)
+                scale = 255.0 / (hi - lo) if hi > lo else 0.0
+                # Scratch only; the quantized bytes are copied into `out`
+                quantized = np.subtract(column, lo, out=self._buffer('quantized', count))
+                quantized *= scale
+                np.rint(quantized, out=quantized)
+                out[...] = quantized
+                ranges[key] = (lo, hi)
+            else:
+                out[...] = column
+            packed[key] = out.data
+        
+        state = {
+            'n': count,
+            'dtype': {'float': float_format, 'int': 'i4'},
+            'float_fields': float_fields,
+            'int_fields': int_fields,
+            'columns': packed,
+            'time': self.time,
+        }
+        if float_format == 'u1':
+            state['ranges'] = ranges
+        return state
+    
+    def _serialize_nodes(self) -> List[Dict]:
+        """Serialize every node, reading each column once rather than per node."""
+        keys = [key for key, _ in NODE_WIRE_FIELDS]
+        return [dict(zip(keys, row)) for row in zip(*self.get_node_columns().values())]
+    
+    def _serialize_cluster(self, cluster: Dict) -> Dict:
+        """Serialize a cluster with member positions instead of node objects."""
+        serialized = {key: value for key, value in cluster.items() if key != 'nodes'}
+        serialized['nodes'] = [{'id': node.node_id, 'x': node.x, 'y': node.y} for node in cluster['nodes']]
+        return serialized
+    
     def update_params(self, new_params: Dict[str, float]):
         """Update physics parameters."""
         self.params.update(new_params)
\ No newline at end of file
@@ -8,11 +8,16 @@ For the full GPU-accelerated version, install: pip install numpy torch fastapi u
 import math
 import random
 import time
+from collections import deque
 import json
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, NamedTuple, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Gaussian attention field A(x): σ = 200 centred at (0, 0), exponent factor 1 / (2σ²)
+ATTENTION_SIGMA = 200.0
+ATTENTION_INV_2SIGMA2 = 1.0 / (2 * ATTENTION_SIGMA**2)
+
 class UniverseMode(Enum):
     CONSCIOUSNESS = "consciousness"
     ATTENTION = "attention" 
@@ -20,6 +25,40 @@ class UniverseMode(Enum):
     TEMPORAL = "temporal"
     MULTIVERSE = "multiverse"
 
+class PhysicsParams(NamedTuple):
+    """Physics parameters read once per frame, so node updates skip dict lookups."""
+    gravity: float = 0.0
+    friction: float = 0.99
+    elasticity: float = 0.8
+    time_dilation: float = 1.0
+    field_strength: float = 1.0
+    
+    @classmethod
+    def from_dict(cls, params: Dict[str, float]) -> 'PhysicsParams':
+        """Snapshot the known keys of a params dict, defaulting the rest."""
+        return cls(**{name: float(params[name]) for name in cls._fields if name in params})
+
+class FrameConstants(NamedTuple):
+    """Per-frame scalars derived once from PhysicsParams, shared by every node update."""
+    delta_time: float  # Time-dilated frame time
+    step: float  # delta_time * 60, the 60 fps frame ratio
+    friction: float  # Velocity factor friction ** step
+    gravity_force: float  # Center pull per frame
+    phase_step: float  # Phase advance per Hz of frequency
+    
+    @classmethod
+    def for_frame(cls, delta_time: float, params: PhysicsParams) -> 'FrameConstants':
+        """Derive the constants for one frame of length delta_time."""
+        delta_time *= params.time_dilation
+        step = delta_time * 60
+        return cls(
+            delta_time=delta_time,
+            step=step,
+            friction=params.friction ** step,
+            gravity_force=params.gravity * 0.001 * step,
+            phase_step=delta_time * 2 * math.pi / 1000,
+        )
+
 @dataclass
 class ConsciousnessNode:
     """
@@ -65,12 +104,20 @@ class ConsciousnessNode:
     cluster_id: int = -1
     thought_intensity: float = 0.0
     recursion_level: int = 0
+    node_id: int = 0  # Stable identifier, sent as the node's 'id'
 
-    def update(self, delta_time: float, params: Dict[str, float], mouse_influence: Optional[Dict] = None):
-        """Update consciousness node using Core EQ calculations."""
+    def update(self, delta_time: float, params: PhysicsParams, mouse_influence: Optional[Dict] = None,
+               frame: Optional[FrameConstants] = None):
+        """Update consciousness node using Core EQ calculations.
+        
+        `frame` carries the per-frame constants when the lattice updates many
+        nodes at once; it is derived from delta_time and params otherwise.
+        """
+        if frame is None:
+            frame = FrameConstants.for_frame(delta_time, params)
         
         # Apply time dilation
-        delta_time *= params.get('time_dilation', 1.0)
+        delta_time = frame.delta_time
         
         # Calculate consciousness value: C = A(x) * Φ(x) * e^(iτ(x))
         # e^(iτ) = cos(τ) + i*sin(τ)
@@ -78,11 +125,12 @@ class ConsciousnessNode:
         sin_tau = math.sin(self.phase)
         
         # C is complex: C = A(x) * Φ(x) * (cos(τ) + i*sin(τ))
-        self.consciousness_re = self.attention * self.frequency * cos_tau
-        self.consciousness_im = self.attention * self.frequency * sin_tau
+        amplitude = self.attention * self.frequency
+        self.consciousness_re = amplitude * cos_tau
+        self.consciousness_im = amplitude * sin_tau
         
         # Evolve phase based on frequency (simple evolution)
-        self.phase += self.frequency * delta_time * 2 * math.pi / 1000
+        self.phase += self.frequency * frame.phase_step
         self.phase = self.phase % (2 * math.pi)  # Keep in [0, 2π)
         
         # Apply mouse interaction if provided
@@ -90,16 +138,16 @@ class ConsciousnessNode:
             self._apply_mouse_interaction(mouse_influence, delta_time, params)
         
         # Apply gravity and physics
-        self._apply_physics(delta_time, params)
+        self._apply_physics(frame, params)
         
         # Update tensor system
         self._update_intelligence_tensors(delta_time, params)
         
         # Update radius based on consciousness magnitude |C|
-        consciousness_magnitude = math.sqrt(self.consciousness_re**2 + self.consciousness_im**2)
+        consciousness_magnitude = math.hypot(self.consciousness_re, self.consciousness_im)
         self.radius = self.base_radius + consciousness_magnitude * 0.1
 
-    def _apply_mouse_interaction(self, mouse_influence: Dict, delta_time: float, params: Dict[str, float]):
+    def _apply_mouse_interaction(self, mouse_influence: Dict, delta_time: float, params: PhysicsParams):
         """Apply mouse interaction forces based on mode."""
         mouse_x = mouse_influence.get('x', 0)
         mouse_y = mouse_influence.get('y', 0)
@@ -111,53 +159,59 @@ class ConsciousnessNode:
             
         dx_mouse = mouse_x - self.x
         dy_mouse = mouse_y - self.y
-        distance_mouse = math.sqrt(dx_mouse**2 + dy_mouse**2)
-        max_distance = 200 * params.get('field_strength', 1.0)
-        
-        if distance_mouse < max_distance:
-            angle = math.atan2(dy_mouse, dx_mouse)
+        distance_sq = dx_mouse * dx_mouse + dy_mouse * dy_mouse
+        max_distance = 200 * params.field_strength
+        
+        # Compare squared distances; only nodes in range need the sqrt
+        if max_distance > 0 and distance_sq < max_distance * max_distance:
+            distance_mouse = math.sqrt(distance_sq)
+            # Unit vector toward the mouse; a node exactly under it is pushed along +x
+            if distance_mouse > 0:
+                ux = dx_mouse / distance_mouse
+                uy = dy_mouse / distance_mouse
+            else:
+                ux, uy = 1.0, 0.0
             force = (max_distance - distance_mouse) / max_distance
-            force *= params.get('field_strength', 1.0)
+            force *= params.field_strength
             
             if interaction_mode == 'push':
                 # Repel from mouse
-                self.vx -= math.cos(angle) * force * 0.4 * delta_time * 60
-                self.vy -= math.sin(angle) * force * 0.4 * delta_time * 60
+                self.vx -= ux * force * 0.4 * delta_time * 60
+                self.vy -= uy * force * 0.4 * delta_time * 60
             elif interaction_mode == 'pull':
                 # Attract to mouse
-                self.vx += math.cos(angle) * force * 0.4 * delta_time * 60
-                self.vy += math.sin(angle) * force * 0.4 * delta_time * 60
+                self.vx += ux * force * 0.4 * delta_time * 60
+                self.vy += uy * force * 0.4 * delta_time * 60
             elif interaction_mode == 'vortex':
-                # Create vortex effect
-                tangential_angle = angle + math.pi/2
-                self.vx += math.cos(tangential_angle) * force * 0.5 * delta_time * 60
-                self.vy += math.sin(tangential_angle) * force * 0.5 * delta_time * 60
+                # Create vortex effect along the tangent (-uy, ux)
+                self.vx -= uy * force * 0.5 * delta_time * 60
+                self.vy += ux * force * 0.5 * delta_time * 60
             elif interaction_mode == 'wave':
                 # Wave-like movement
                 time_factor = time.time() * 10
                 wave_force = math.sin(distance_mouse * 0.05 - time_factor) * force
-                self.vx += math.cos(angle) * wave_force * 0.5 * delta_time * 60
-                self.vy += math.sin(angle) * wave_force * 0.5 * delta_time * 60
+                self.vx += ux * wave_force * 0.5 * delta_time * 60
+                self.vy += uy * wave_force * 0.5 * delta_time * 60
 
-    def _apply_physics(self, delta_time: float, params: Dict[str, float]):
+    def _apply_physics(self, frame: FrameConstants, params: PhysicsParams):
         """Apply gravity, friction, and boundary conditions."""
         
         # Apply gravity (center attraction)
-        if params.get('gravity', 0) > 0:
+        if params.gravity > 0:
             dx = 0 - self.x
             dy = 0 - self.y
-            dist_center = math.sqrt(dx**2 + dy**2)
-            if dist_center > 10:
-                gravity_force = params['gravity'] * 0.001 * delta_time * 60
-                self.vx += (dx / dist_center) * gravity_force
-                self.vy += (dy / dist_center) * gravity_force
+            dist_center_sq = dx * dx + dy * dy
+            if dist_center_sq > 100:
+                pull = frame.gravity_force / math.sqrt(dist_center_sq)
+                self.vx += dx * pull
+                self.vy += dy * pull
         
         # Update position
-        self.x += self.vx * delta_time * 60
-        self.y += self.vy * delta_time * 60
+        self.x += self.vx * frame.step
+        self.y += self.vy * frame.step
         
         # Apply friction
-        friction = params.get('friction', 0.99) ** (delta_time * 60)
+        friction = frame.friction
         self.vx *= friction
         self.vy *= friction
         
@@ -169,37 +223,43 @@ class ConsciousnessNode:
             if random.random() < 0.05:  # 5% quantum tunneling
                 self.x = world_bounds_x/2 if self.x < -world_bounds_x/2 else -world_bounds_x/2
             else:
-                self.vx *= -0.8 * params.get('elasticity', 0.8)
+                self.vx *= -0.8 * params.elasticity
                 self.x = max(-world_bounds_x/2, min(world_bounds_x/2, self.x))
                 
         if self.y < -world_bounds_y/2 or self.y > world_bounds_y/2:
             if random.random() < 0.05:
                 self.y = world_bounds_y/2 if self.y < -world_bounds_y/2 else -world_bounds_y/2
             else:
-                self.vy *= -0.8 * params.get('elasticity', 0.8)
+                self.vy *= -0.8 * params.elasticity
                 self.y = max(-world_bounds_y/2, min(world_bounds_y/2, self.y))
 
-    def _update_intelligence_tensors(self, delta_time: float, params: Dict[str, float]):
+    def _update_intelligence_tensors(self, delta_time: float, params: PhysicsParams):
         """Update 2D intelligence tensor system."""
-        evolution_rate = 0.02 * params.get('time_dilation', 1.0)
+        evolution_rate = 0.02 * params.time_dilation
+        memory_rate = evolution_rate * 0.1
+        processing_rate = evolution_rate * 0.15
+        
+        # Unpack each tensor once and evolve in locals
+        logic_x, logic_y = self.logic_tensor
+        memory_x, memory_y = self.memory_tensor
+        processing_x, processing_y = self.processing_tensor
         
         # Simple tensor evolution with coupling
         # Logic influences Memory
-        self.memory_tensor = (
-            self.memory_tensor[0] + self.logic_tensor[0] * evolution_rate * 0.1,
-            self.memory_tensor[1] + self.logic_tensor[1] * evolution_rate * 0.1
-        )
+        memory_x += logic_x * memory_rate
+        memory_y += logic_y * memory_rate
         
         # Memory influences Processing
-        self.processing_tensor = (
-            self.processing_tensor[0] + self.memory_tensor[0] * evolution_rate * 0.15,
-            self.processing_tensor[1] + self.memory_tensor[1] * evolution_rate * 0.15
-        )
+        processing_x += memory_x * processing_rate
+        processing_y += memory_y * processing_rate
+        
+        self.memory_tensor = (memory_x, memory_y)
+        self.processing_tensor = (processing_x, processing_y)
         
         # Calculate emergent properties
-        logic_magnitude = math.sqrt(self.logic_tensor[0]**2 + self.logic_tensor[1]**2)
-        memory_magnitude = math.sqrt(self.memory_tensor[0]**2 + self.memory_tensor[1]**2)
-        processing_magnitude = math.sqrt(self.processing_tensor[0]**2 + self.processing_tensor[1]**2)
+        logic_magnitude = math.hypot(logic_x, logic_y)
+        memory_magnitude = math.hypot(memory_x, memory_y)
+        processing_magnitude = math.hypot(processing_x, processing_y)
         
         self.consciousness_depth = min(1.0, (logic_magnitude + memory_magnitude + processing_magnitude) / 3)
         self.self_awareness = min(1.0, logic_magnitude * 0.8 + self.thought_intensity * 0.2)
@@ -209,13 +269,13 @@ class ConsciousnessNode:
 
     def calculate_attention_density(self) -> float:
         """Calculate A(x) based on Gaussian distribution centered at (0,0)."""
-        sigma = 200.0  # Standard deviation for attention field
-        d_sq = self.x**2 + self.y**2
-        return math.exp(-d_sq / (2 * sigma**2))
+        d_sq = self.x * self.x + self.y * self.y
+        return math.exp(-d_sq * ATTENTION_INV_2SIGMA2)
 
     def to_dict(self) -> Dict:
         """Serialize node state for WebSocket transmission."""
         return {
+            'id': self.node_id,
             'x': self.x,
             'y': self.y,
             'radius': self.radius,
@@ -245,15 +305,18 @@ class Universe:
 
     def update(self, time_factor: float):
         """Update universe-specific effects on contained nodes."""
+        # The modulation is the same for every node of this universe this frame
+        modulation = 1 + self.resonance_coeff * 0.2 * math.sin(time_factor * 0.05)
+        contains_node = self._contains_node
         for node in self.nodes:
-            if self._contains_node(node):
-                # Apply universe-specific frequency modulation
-                node.frequency = node.base_frequency * (1 + self.resonance_coeff * 0.2 * math.sin(time_factor * 0.05))
+            if contains_node(node):
+                node.frequency = node.base_frequency * modulation
 
     def _contains_node(self, node: ConsciousnessNode) -> bool:
         """Check if node is within this universe's boundary."""
-        dist = math.sqrt((node.x - self.center_x)**2 + (node.y - self.center_y)**2)
-        return dist < self.radius
+        dx = node.x - self.center_x
+        dy = node.y - self.center_y
+        return dx * dx + dy * dy < self.radius * self.radius
 
     def to_dict(self) -> Dict:
         """Serialize universe state."""
@@ -276,24 +339,45 @@ class ConsciousnessLattice:
     def __init__(self, grid_size: int = 128, universe_count: int = 3):
         self.grid_size = grid_size
         self.universe_count = universe_count
-        self.time = 0.0
         
         # Initialize nodes and universes
         self.nodes: List[ConsciousnessNode] = []
         self.universes: List[Universe] = []
         self.clusters: List[Dict] = []
         
+        # Physics parameters
+        self.params: Dict[str, float] = {}
+        
+        # Squared cluster proximity threshold (80 units), compared against squared distances
+        self._cluster_thresh_sq = 80.0 * 80.0
+        
+        self.reset_in_place()
+        
+    def reset_in_place(self):
+        """Restart the simulation from a fresh random state, reusing this lattice's containers.
+
+        Callers holding a reference to the lattice keep seeing the live
+        simulation, unlike replacing the lattice object.
+        """
+        self.time = 0.0
+        self._next_node_id = 0
+        self._global_stats_cache: Optional[Dict[str, float]] = None
+        
+        self.nodes.clear()
+        self.universes.clear()
+        self.clusters.clear()
+        
         # Dirichlet-sampled λ weights for universes
-        self.lambdas = self._sample_dirichlet([1.0] * universe_count)
+        self.lambdas = self._sample_dirichlet([1.0] * self.universe_count)
         
-        # Physics parameters
-        self.params = {
+        self.params.clear()
+        self.params.update({
             'gravity': 1.0,
             'friction': 0.99,
             'elasticity': 0.8,
             'time_dilation': 1.0,
             'field_strength': 1.0
-        }
+        })
         
         # Initialize system
         self._initialize_universes()
@@ -301,7 +385,7 @@ class ConsciousnessLattice:
         self._normalize_attention_field()
         
         # Performance tracking
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
         
     def _sample_dirichlet(self, alpha: List[float]) -> List[float]:
         """Simplified Dirichlet sampling using gamma distribution approximation."""
@@ -314,9 +398,14 @@ class ConsciousnessLattice:
         total = sum(samples)
         return [s / total for s in samples]
     
+    def _allocate_node_id(self) -> int:
+        """Return the next stable node identifier."""
+        node_id = self._next_node_id
+        self._next_node_id += 1
+        return node_id
+    
     def _initialize_universes(self):
         """Create universes with sampled λ coefficients."""
-        self.universes = []
         for i in range(self.universe_count):
             universe = Universe(
                 id=i,
@@ -329,8 +418,6 @@ class ConsciousnessLattice:
     
     def _initialize_nodes(self):
         """Initialize consciousness nodes on the manifold."""
-        self.nodes = []
-        
         for i in range(self.grid_size):
             # Random placement within visible world
             x = random.uniform(-500, 500)
@@ -342,6 +429,7 @@ class ConsciousnessLattice:
             # Create node with Core EQ parameters
             node = ConsciousnessNode(
                 x=x, y=y,
+                node_id=self._allocate_node_id(),
                 frequency=40.0 + random.uniform(-5, 5),  # 40Hz ± 5Hz
                 phase=random.uniform(0, 2*math.pi),  # Random phase
                 universe_id=universe_id,
@@ -369,23 +457,27 @@ class ConsciousnessLattice:
         
         # Normalize
         if total_attention > 0:
+            scale = 1.0 / total_attention
             for node in self.nodes:
-                node.attention /= total_attention
+                node.attention *= scale
     
     def update(self, delta_time: float, mouse_influence: Optional[Dict] = None):
         """Update the entire consciousness lattice."""
-        current_time = time.time()
+        # Monotonic, so a wall-clock step can never make delta time negative
+        current_time = time.monotonic()
         actual_delta_time = min(0.05, current_time - self.last_update_time)
         self.last_update_time = current_time
         
-        self.time += actual_delta_time * self.params['time_dilation']
+        params = PhysicsParams.from_dict(self.params)
+        self.time += actual_delta_time * params.time_dilation
+        self._invalidate_global_stats()
         
         # Update universes
         for universe in self.universes:
             universe.update(self.time)
         
         # Update nodes with node-to-node interactions
-        self._update_nodes_with_interactions(actual_delta_time, mouse_influence)
+        self._update_nodes_with_interactions(actual_delta_time, params, mouse_influence)
         
         # Update clusters and intelligence
         self._update_clusters()
@@ -393,82 +485,97 @@ class ConsciousnessLattice:
         # Calculate global consciousness value
         return self._calculate_global_consciousness()
     
-    def _update_nodes_with_interactions(self, delta_time: float, mouse_influence: Optional[Dict] = None):
+    def _update_nodes_with_interactions(self, delta_time: float, params: PhysicsParams,
+                                        mouse_influence: Optional[Dict] = None):
         """Update all nodes including mutual interactions."""
+        repulsion_strength = 0.5 * delta_time * 60 * params.elasticity
+        frame = FrameConstants.for_frame(delta_time, params)
+        # Bind loop-invariant lookups to locals for the N² inner loop
+        nodes = self.nodes
+        sqrt = math.sqrt
         
         # Calculate repulsion forces between nodes
-        for i, node in enumerate(self.nodes):
+        for i, node in enumerate(nodes):
             # Reset forces
             repulsion_x = 0.0
             repulsion_y = 0.0
             
             # Calculate repulsion from other nodes
-            for j, other_node in enumerate(self.nodes):
+            x, y = node.x, node.y
+            contact_distance = node.radius + 10
+            for j, other_node in enumerate(nodes):
                 if i == j:
                     continue
                     
-                dx = other_node.x - node.x
-                dy = other_node.y - node.y
-                distance = math.sqrt(dx**2 + dy**2)
-                min_distance = node.radius + other_node.radius + 10
+                dx = other_node.x - x
+                dy = other_node.y - y
+                distance_sq = dx * dx + dy * dy
+                min_distance = contact_distance + other_node.radius
                 
-                if distance < min_distance and distance > 0:
-                    force = (min_distance - distance) / min_distance
-                    angle = math.atan2(dy, dx)
-                    repulsion_strength = 0.5 * delta_time * 60 * self.params['elasticity']
-                    repulsion_x -= math.cos(angle) * force * repulsion_strength
-                    repulsion_y -= math.sin(angle) * force * repulsion_strength
+                if distance_sq < min_distance * min_distance and distance_sq > 0:
+                    # Push along the unit vector (dx, dy) / distance; no angle needed
+                    distance = sqrt(distance_sq)
+                    scale = (min_distance - distance) / (min_distance * distance) * repulsion_strength
+                    repulsion_x -= dx * scale
+                    repulsion_y -= dy * scale
             
             # Apply repulsion
             node.vx += repulsion_x
             node.vy += repulsion_y
             
             # Update node
-            node.update(delta_time, self.params, mouse_influence)
+            node.update(delta_time, params, mouse_influence, frame)
     
     def _update_clusters(self):
         """Detect and update consciousness clusters."""
+        nodes = self.nodes
+        threshold_sq = self._cluster_thresh_sq
+        sin = math.sin
+        
         # Reset cluster assignments
-        for node in self.nodes:
+        for node in nodes:
             node.cluster_id = -1
         
         self.clusters = []
-        processed = set()
+        # processed[i] is 1 once node i has joined a cluster
+        processed = bytearray(len(nodes))
         
         # Build clusters based on proximity and phase/frequency alignment
-        for i, node in enumerate(self.nodes):
-            if i in processed:
+        for i, node in enumerate(nodes):
+            if processed[i]:
                 continue
                 
             cluster_nodes = [node]
-            processed.add(i)
-            queue = [i]
+            processed[i] = 1
+            # Each node is queued at most once (guarded by processed)
+            queue = deque([i])
             
             while queue:
-                current_idx = queue.pop(0)
-                current_node = self.nodes[current_idx]
+                current_idx = queue.popleft()
+                current_node = nodes[current_idx]
+                current_x, current_y = current_node.x, current_node.y
+                current_phase, current_frequency = current_node.phase, current_node.frequency
                 
-                for j, candidate in enumerate(self.nodes):
-                    if j in processed:
+                for j, candidate in enumerate(nodes):
+                    if processed[j]:
                         continue
                         
-                    dx = candidate.x - current_node.x
-                    dy = candidate.y - current_node.y
-                    distance = math.sqrt(dx**2 + dy**2)
+                    dx = candidate.x - current_x
+                    dy = candidate.y - current_y
                     
-                    if distance < 80:  # Cluster proximity threshold
+                    if dx * dx + dy * dy < threshold_sq:  # Cluster proximity threshold
                         # Check phase compatibility
-                        phase_diff = abs(math.sin(current_node.phase - candidate.phase))
+                        phase_diff = abs(sin(current_phase - candidate.phase))
                         phase_compatible = phase_diff < 0.5
                         
                         # Check frequency compatibility
-                        freq_ratio = min(current_node.frequency, candidate.frequency) / max(current_node.frequency, candidate.frequency)
+                        freq_ratio = min(current_frequency, candidate.frequency) / max(current_frequency, candidate.frequency)
                         freq_compatible = freq_ratio > 0.7
                         
                         if phase_compatible and freq_compatible:
                             cluster_nodes.append(candidate)
                             queue.append(j)
-                            processed.add(j)
+                            processed[j] = 1
             
             # Create cluster if significant
             if len(cluster_nodes) >= 3:
@@ -488,7 +595,22 @@ class ConsciousnessLattice:
                 
                 self.clusters.append(cluster)
     
+    def _invalidate_global_stats(self):
+        """Drop the cached global stats after the nodes have changed."""
+        self._global_stats_cache = None
+    
     def _calculate_global_consciousness(self) -> Dict[str, float]:
+        """Return the global consciousness stats, computed at most once per change.
+
+        Servers read the stats several times per tick (the update result,
+        state frames, /api/stats); only the first read walks the nodes.
+        The returned dict is shared and must not be mutated.
+        """
+        if self._global_stats_cache is None:
+            self._global_stats_cache = self._compute_global_consciousness()
+        return self._global_stats_cache
+    
+    def _compute_global_consciousness(self) -> Dict[str, float]:
         """Calculate global consciousness integral C = ∫A(x)Φ(x)e^(iτ(x))dμ(x)."""
         total_consciousness_re = 0.0
         total_consciousness_im = 0.0
@@ -504,7 +626,7 @@ class ConsciousnessLattice:
             total_phase += node.phase
         
         # Calculate magnitude |C|
-        consciousness_magnitude = math.sqrt(total_consciousness_re**2 + total_consciousness_im**2)
+        consciousness_magnitude = math.hypot(total_consciousness_re, total_consciousness_im)
         
         return {
             'consciousness_magnitude': consciousness_magnitude,
@@ -522,6 +644,7 @@ class ConsciousnessLattice:
         
         node = ConsciousnessNode(
             x=x, y=y,
+            node_id=self._allocate_node_id(),
             frequency=40.0 + random.uniform(-5, 5),
             phase=random.uniform(0, 2*math.pi),
             universe_id=universe_id,
@@ -534,6 +657,8 @@ class ConsciousnessLattice:
         self.nodes.append(node)
         self.universes[universe_id].nodes.append(node)
         
+        self._invalidate_global_stats()
+        
         return node
     
     def quantum_collapse(self, x: float, y: float):
@@ -541,9 +666,11 @@ class ConsciousnessLattice:
         for node in self.nodes:
             dx = node.x - x
             dy = node.y - y
-            distance = math.sqrt(dx**2 + dy**2)
+            distance_sq = dx * dx + dy * dy
             
-            if distance < 200:  # Collapse radius
+            if distance_sq < 200 * 200:  # Collapse radius
+                distance = math.sqrt(distance_sq)
+                
                 # Reset consciousness and add random phase shift
                 node.consciousness_re = 0
                 node.consciousness_im = 0
@@ -552,10 +679,11 @@ class ConsciousnessLattice:
                 
                 # Add outward force
                 if distance > 0:
-                    angle = math.atan2(dy, dx)
-                    push_force = (200 - distance) / 200 * 5
-                    node.vx += math.cos(angle) * push_force
-                    node.vy += math.sin(angle) * push_force
+                    push_scale = (200 - distance) / 200 * 5 / distance
+                    node.vx += dx * push_scale
+                    node.vy += dy * push_scale
+        
+        self._invalidate_global_stats()
     
     def set_mode(self, mode: UniverseMode):
         """Set visualization mode (affects frontend rendering)."""
@@ -7,41 +7,92 @@ This server wraps the Python lattice engine and provides:
 - Binary/JSON serialization for efficient data transmission
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
 import asyncio
-import json
-import time
+import hashlib
+import msgspec
+import orjson
 import logging
-from pathlib import Path
 
-from .lattice import ConsciousnessLattice, UniverseMode
+from .lattice import BINARY_FLOAT_FORMATS, ConsciousnessLattice, UniverseMode
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, which handles numpy arrays natively."""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
 # FastAPI app
 app = FastAPI(
     title="CONSIM Consciousness Lattice Engine",
     description="Real-time consciousness field simulation with WebSocket streaming",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Global lattice instance
 lattice = ConsciousnessLattice(grid_size=128, universe_count=3)
 
+# lattice.update runs on this thread so the event loop keeps serving clients
+# while NumPy (which releases the GIL) computes the frame
+physics_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="physics")
+
+# Held across each physics step; handlers that read or modify the lattice take
+# it so they never see or change a half-updated frame. The mouse queue is a
+# deque and needs no lock.
+lattice_lock = asyncio.Lock()
+
 # Connected WebSocket clients
-connected_clients: List[WebSocket] = []
+connected_clients: Set[WebSocket] = set()
+
+# /stream clients that asked for MessagePack frames (?format=msgpack)
+msgpack_clients: Set[WebSocket] = set()
+
+# Each /stream client's newest mouse influence, handed to the lattice once per
+# frame so a fast mouse costs one influence per client per update
+pending_mouse: Dict[WebSocket, 'MouseData'] = {}
+
+# Delta-stream clients, mapped to the lattice.version of the last frame they
+# were sent (None before their first frame)
+state_clients: Dict[WebSocket, Optional[int]] = {}
+
+# The last frame sent to delta clients, as (lattice.version, nodes by id)
+last_delta_frame: Tuple[Optional[int], Dict[int, Dict]] = (None, {})
+
+# Delta clients are resent the full state this often, in simulation frames
+KEYFRAME_INTERVAL = 120
+
+# Binary-stream clients by float format, sent packed node columns every tick
+binary_clients: Dict[str, Set[WebSocket]] = {float_format: set() for float_format in BINARY_FLOAT_FORMATS}
+
+# Outbound frames of each broadcast client, sent in order by its writer task
+client_queues: Dict[WebSocket, asyncio.Queue] = {}
+
+# Frames a client may have waiting; enqueueing beyond this drops the oldest
+CLIENT_QUEUE_SIZE = 2
+
+# A writer whose send makes no progress for this long closes its client
+STALLED_CLIENT_TIMEOUT = 5.0
 
 # Simulation state
 simulation_running = False
 target_fps = 10  # Reduce from 60fps to 10fps to prevent blocking
 frame_time = 1.0 / target_fps
 
+# Retry delays after a failed simulation frame, doubling up to the maximum
+ERROR_BACKOFF_MIN = 0.1
+ERROR_BACKOFF_MAX = 2.0
+
 class ParameterUpdate(BaseModel):
     """Model for parameter updates."""
     gravity: Optional[float] = None
@@ -55,6 +106,10 @@ class NodeCreate(BaseModel):
     x: float
     y: float
 
+class NodeBulkCreate(BaseModel):
+    """Model for creating several nodes in one request."""
+    points: List[Tuple[float, float]]
+
 class MouseInfluence(BaseModel):
     """Model for mouse interaction."""
     x: float
@@ -67,19 +122,73 @@ class QuantumCollapse(BaseModel):
     x: float
     y: float
 
+# WebSocket client messages: {"type": ..., "data": {...}}, decoded and
+# validated in one pass. Unknown fields (such as the client's timestamp) are ignored.
+
+class MouseData(msgspec.Struct):
+    """Mouse position and interaction mode, as read by the lattice."""
+    x: float = 0.0
+    y: float = 0.0
+    mode: str = "push"
+    active: bool = False
+
+class ParameterData(msgspec.Struct, omit_defaults=True):
+    """Physics parameters to change; omitted ones keep their value."""
+    gravity: Optional[float] = None
+    friction: Optional[float] = None
+    elasticity: Optional[float] = None
+    time_dilation: Optional[float] = None
+    field_strength: Optional[float] = None
+
+class PointData(msgspec.Struct):
+    """A lattice position."""
+    x: float = 0.0
+    y: float = 0.0
+
+class ModeData(msgspec.Struct):
+    """A UniverseMode value; unknown modes fail validation."""
+    mode: UniverseMode = UniverseMode.CONSCIOUSNESS
+
+class MouseInfluenceMessage(msgspec.Struct, tag='mouse_influence', tag_field='type'):
+    """Mouse interaction, queued for the next update."""
+    data: MouseData = msgspec.field(default_factory=MouseData)
+
+class ParameterUpdateMessage(msgspec.Struct, tag='parameter_update', tag_field='type'):
+    """Physics parameter change."""
+    data: ParameterData = msgspec.field(default_factory=ParameterData)
+
+class AddNodeMessage(msgspec.Struct, tag='add_node', tag_field='type'):
+    """Request for a new node."""
+    data: PointData = msgspec.field(default_factory=PointData)
+
+class QuantumCollapseMessage(msgspec.Struct, tag='quantum_collapse', tag_field='type'):
+    """Quantum collapse event."""
+    data: PointData = msgspec.field(default_factory=PointData)
+
+class SetModeMessage(msgspec.Struct, tag='set_mode', tag_field='type'):
+    """Visualization mode change."""
+    data: ModeData = msgspec.field(default_factory=ModeData)
+
+ClientMessage = Union[MouseInfluenceMessage, ParameterUpdateMessage, AddNodeMessage,
+                      QuantumCollapseMessage, SetModeMessage]
+
+# Built once at import and shared by every /stream connection; decode()
+# keeps no state between calls
+client_message_decoder = msgspec.json.Decoder(ClientMessage)
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the simulation on startup."""
     global simulation_running
     simulation_running = True
+    
+    # The landing page is read once; GET / serves these bytes from memory
+    app.state.index_bytes = Path("static/index.html").read_bytes()
+    app.state.index_etag = f'"{hashlib.md5(app.state.index_bytes).hexdigest()}"'
     logger.info("Consciousness lattice engine initialized")
     
-    # Defer simulation loop start to avoid blocking startup
-    asyncio.create_task(delayed_simulation_start())
-
-async def delayed_simulation_start():
-    """Start simulation loop after a short delay."""
-    await asyncio.sleep(0.1)  # Short delay to ensure startup completes
+    # The task first runs once startup yields back to the event loop, so it
+    # never blocks startup and needs no artificial delay
     asyncio.create_task(simulation_loop())
     logger.info("Simulation loop started")
 
@@ -88,161 +197,453 @@ async def shutdown_event():
     """Clean shutdown."""
     global simulation_running
     simulation_running = False
+    physics_executor.shutdown(wait=True)
     logger.info("Consciousness lattice engine stopped")
 
+# Built once at import and shared by simulation_loop and new /stream clients.
+# Both encode on the event loop thread (never the physics executor), so calls
+# on this encoder never overlap. Frame state holds only lists, dicts and
+# Python scalars, so no enc_hook is needed.
+msgpack_encoder = msgspec.msgpack.Encoder()
+
+def build_state_delta(state: Dict, last_nodes: Dict[int, Dict]) -> Dict:
+    """Describe the node changes since the previous frame.
+
+    With no previous frame every node is 'added', which makes the delta a
+    full state.
+    """
+    delta = {key: value for key, value in state.items() if key != 'nodes'}
+    delta['added'] = []
+    delta['changed'] = []
+    
+    current_ids = set()
+    for node in state['nodes']:
+        node_id = node['id']
+        current_ids.add(node_id)
+        previous = last_nodes.get(node_id)
+        if previous is None:
+            delta['added'].append(node)
+        elif previous != node:
+            delta['changed'].append(node)
+    
+    delta['removed'] = [node_id for node_id in last_nodes if node_id not in current_ids]
+    return delta
+
+async def send_within_frame(client: WebSocket, payload: bytes):
+    """Send payload to client, raising TimeoutError if it takes longer than half a frame.
+
+    A stalled client then costs the simulation loop at most half a frame
+    instead of blocking it until the client's TCP buffer drains.
+    """
+    await asyncio.wait_for(client.send_bytes(payload), timeout=frame_time * 0.5)
+
+async def drop_clients(failures: Dict[WebSocket, Exception]):
+    """Log failed sends and close the clients that timed out.
+
+    A timed-out send may have been cut off mid-message, so that client's
+    stream is no longer usable; 1013 asks it to try again later.
+    """
+    slow_clients = []
+    for client, error in failures.items():
+        if isinstance(error, asyncio.TimeoutError):
+            logger.warning("Client too slow to receive frames; disconnecting")
+            slow_clients.append(client)
+        else:
+            logger.warning("Client disconnected: %s", error)
+    
+    await asyncio.gather(*(asyncio.wait_for(client.close(code=1013), timeout=frame_time)
+                           for client in slow_clients), return_exceptions=True)
+
+async def broadcast_state_deltas(state: Dict, version: int):
+    """Send delta-stream clients the changes since the previous frame, or a keyframe.
+
+    Clients that received the previous frame share one encoded delta. New
+    clients, clients that missed a frame, and every client once per
+    KEYFRAME_INTERVAL frames share one keyframe listing every node as added
+    with 'keyframe' set, which replaces whatever the client held. The sends
+    run concurrently, so the slowest client bounds the broadcast.
+    
+    version is the lattice.version the state was taken at; the lattice may
+    already be computing the next frame while this runs.
+    """
+    global last_delta_frame
+    previous_version, previous_nodes = last_delta_frame
+    keyframe_due = version % KEYFRAME_INTERVAL == 0
+    payloads = {}
+    clients = list(state_clients.items())
+    
+    sends = []
+    for client, last_version in clients:
+        keyframe = keyframe_due or last_version is None or last_version != previous_version
+        if keyframe not in payloads:
+            delta = build_state_delta(state, {} if keyframe else previous_nodes)
+            delta['version'] = version
+            delta['keyframe'] = keyframe
+            payloads[keyframe] = orjson.dumps(delta, option=orjson.OPT_SERIALIZE_NUMPY)
+        sends.append(send_within_frame(client, payloads[keyframe]))
+    
+    last_delta_frame = (version, {node['id']: node for node in state['nodes']})
+    
+    failures = {}
+    results = await asyncio.gather(*sends, return_exceptions=True)
+    for (client, _), result in zip(clients, results):
+        if isinstance(result, Exception):
+            failures[client] = result
+            state_clients.pop(client, None)
+        elif client in state_clients:
+            state_clients[client] = version
+    await drop_clients(failures)
+
+def encode_binary_frame(binary_state: Dict) -> bytes:
+    """Pack lattice.get_state_binary() into one binary WebSocket frame.
+
+    Layout: a little-endian uint32 header length, an orjson header with 'n',
+    'time', 'dtype', 'float_fields', 'int_fields' (and 'ranges' for 'u1'),
+    space padding to a 4-byte boundary, then n values per float field in
+    dtype['float'], zero padding to a 4-byte boundary, and n int32 values
+    per int field, in header order. Browsers can view the two blocks
+    directly as typed arrays (Float32Array, Uint16Array halves or
+    Uint8Array, and Int32Array).
+    """
+    header_fields = {key: binary_state[key] for key in ('n', 'time', 'dtype', 'float_fields', 'int_fields')}
+    if 'ranges' in binary_state:
+        header_fields['ranges'] = binary_state['ranges']
+    header = orjson.dumps(header_fields)
+    header += b' ' * (-len(header) % 4)
+    # One join copies every column straight into the frame; the columns are
+    # memoryviews, so the float block's padding comes from their byte sizes
+    columns = binary_state['columns']
+    float_columns = [columns[key] for key in binary_state['float_fields']]
+    float_size = sum(column.nbytes for column in float_columns)
+    return b''.join((
+        len(header).to_bytes(4, 'little'),
+        header,
+        *float_columns,
+        bytes(-float_size % 4),
+        *(columns[key] for key in binary_state['int_fields']),
+    ))
+
+async def client_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """Send one client's queued frames until a send fails or stalls."""
+    try:
+        while True:
+            payload = await queue.get()
+            await asyncio.wait_for(websocket.send_bytes(payload), timeout=STALLED_CLIENT_TIMEOUT)
+    except Exception as e:
+        # No further frames are queued for this client; the endpoint cleans up
+        client_queues.pop(websocket, None)
+        await drop_clients({websocket: e})
+
+def start_client_writer(websocket: WebSocket) -> Tuple[asyncio.Queue, asyncio.Task]:
+    """Give a broadcast client its outbound queue and the task that drains it."""
+    queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    client_queues[websocket] = queue
+    return queue, asyncio.create_task(client_writer(websocket, queue))
+
+async def stop_client_writer(websocket: WebSocket, writer: asyncio.Task):
+    """Drop a departing client's queue and wait for its writer to stop."""
+    client_queues.pop(websocket, None)
+    writer.cancel()
+    await asyncio.gather(writer, return_exceptions=True)
+
+def broadcast_payload(clients: Set[WebSocket], payload: bytes):
+    """Queue one pre-encoded frame for every client.
+
+    The payload is encoded once per frame and the simulation loop never
+    waits on a socket: each client's writer task sends at its own pace, and
+    a client that falls behind loses its oldest unsent frame rather than
+    building an unbounded backlog.
+    """
+    for client in clients:
+        queue = client_queues.get(client)
+        if queue is None:
+            continue
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(payload)
+
 async def simulation_loop():
     """Main simulation loop running at target FPS."""
     global lattice, connected_clients
     
-    last_time = time.time()
+    # The event loop's clock is monotonic, so NTP adjustments cannot make
+    # delta_time negative or stretch the frame budget
+    loop = asyncio.get_running_loop()
+    last_time = loop.time()
+    # Frames are due at fixed multiples of frame_time, so sleep overshoot
+    # does not accumulate into a lower frame rate
+    next_deadline = last_time + frame_time
+    backoff = ERROR_BACKOFF_MIN
+    # The previous frame's delta sends, left running across the next physics step
+    delta_send_task: Optional[asyncio.Task] = None
     
     while simulation_running:
-        current_time = time.time()
+        current_time = loop.time()
         delta_time = current_time - last_time
         last_time = current_time
         
         try:
-            # Update lattice
-            global_stats = lattice.update(delta_time)
+            # Each client contributes only its newest mouse position to this frame
+            if pending_mouse:
+                lattice.mouse_influence_queue.extend(map(msgspec.structs.asdict, pending_mouse.values()))
+                pending_mouse.clear()
             
-            # Only get state and serialize if we have connected clients
-            if connected_clients:
-                # Get complete state for transmission
-                state = lattice.get_state_for_transmission()
+            async with lattice_lock:
+                # Update lattice off the event loop, so clients' frames are
+                # sent by their writer tasks while the next one is computed
+                global_stats = await loop.run_in_executor(physics_executor, lattice.update, delta_time)
                 
+                # Build the frame state once for every kind of client
+                has_state_readers = state_clients or connected_clients or msgpack_clients
+                state = lattice.get_state_for_transmission() if has_state_readers else None
+                # Binary states view reused lattice buffers, so pack them now
+                binary_frames = {
+                    float_format: encode_binary_frame(lattice.get_state_binary(float_format))
+                    for float_format, clients in binary_clients.items()
+                    if clients
+                }
+            
+            # Delta frames go out in order: finish the previous frame's sends
+            # (which overlapped this physics step) before starting this one's
+            if delta_send_task is not None:
+                pending_sends, delta_send_task = delta_send_task, None
+                await pending_sends
+            
+            # Readers that joined during that await may find state None (none
+            # were connected when it was built); they start with the next frame.
+            
+            # Delta-stream clients get only what changed since their last frame
+            if state_clients and state is not None:
+                delta_send_task = asyncio.create_task(broadcast_state_deltas(state, lattice.version))
+            
+            # Binary-stream clients get the raw columns, with no per-node dicts
+            for float_format, binary_frame in binary_frames.items():
+                broadcast_payload(binary_clients[float_format], binary_frame)
+            
+            # Only serialize if we have connected clients
+            if connected_clients and state is not None:
                 try:
-                    # Safe JSON serialization with explicit type handling
-                    state_json = json.dumps(state, ensure_ascii=False, separators=(',', ':'))
+                    # orjson writes compact UTF-8 JSON bytes in one C pass
+                    state_json = orjson.dumps(state, option=orjson.OPT_SERIALIZE_NUMPY)
                 except (TypeError, ValueError) as e:
-                    logger.error(f"JSON serialization error: {e}")
-                    # Skip this frame if serialization fails
-                    continue
-                    
-                disconnected_clients = []
-                
-                for client in connected_clients:
-                    try:
-                        await client.send_text(state_json)
-                    except Exception as e:
-                        logger.warning(f"Client disconnected: {e}")
-                        disconnected_clients.append(client)
-                
-                # Remove disconnected clients
-                for client in disconnected_clients:
-                    connected_clients.remove(client)
+                    # Skip this frame for JSON clients; the frame is still paced
+                    logger.error("JSON serialization error: %s", e)
+                else:
+                    broadcast_payload(connected_clients, state_json)
             
-            # Control frame rate - ensure we always sleep to prevent blocking
-            elapsed = time.time() - current_time
-            sleep_time = max(0.01, frame_time - elapsed)  # Minimum 10ms sleep
-            await asyncio.sleep(sleep_time)
+            # MessagePack clients share one binary encoding of the frame
+            if msgpack_clients and state is not None:
+                broadcast_payload(msgpack_clients, msgpack_encoder.encode(state))
+            
+            # Control frame rate - wait for this frame's deadline after sending.
+            # More than a frame behind, resync instead of bursting to catch up.
+            now = loop.time()
+            if now > next_deadline + frame_time:
+                next_deadline = now
+            await asyncio.sleep(max(0.0, next_deadline - now))
+            next_deadline += frame_time
+            if backoff > ERROR_BACKOFF_MIN:
+                logger.info("Simulation loop recovered")
+                backoff = ERROR_BACKOFF_MIN
                 
         except Exception as e:
-            logger.error(f"Error in simulation loop: {e}")
-            await asyncio.sleep(0.1)  # Prevent tight error loop
+            # Back off exponentially while the error persists. Every failure is
+            # logged; the doubling delay limits a persistent error to one line
+            # per ERROR_BACKOFF_MAX.
+            logger.error("Error in simulation loop (retrying in %.1fs): %r", backoff, e)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, ERROR_BACKOFF_MAX)
+    
+    if delta_send_task is not None:
+        await asyncio.gather(delta_send_task, return_exceptions=True)
 
 @app.websocket("/stream")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time consciousness field streaming."""
+    """WebSocket endpoint for real-time consciousness field streaming.
+
+    Frames are binary messages holding UTF-8 JSON by default. With
+    ?format=msgpack they hold the same state as MessagePack instead.
+    """
     await websocket.accept()
-    connected_clients.append(websocket)
-    logger.info(f"Client connected. Total clients: {len(connected_clients)}")
+    use_msgpack = websocket.query_params.get('format') == 'msgpack'
+    clients = msgpack_clients if use_msgpack else connected_clients
+    queue, writer = start_client_writer(websocket)
     
     try:
-        # Send initial state
+        # Queue the initial state ahead of any broadcast frame
         try:
-            initial_state = lattice.get_state_for_transmission()
-            initial_json = json.dumps(initial_state, ensure_ascii=False, separators=(',', ':'))
-            await websocket.send_text(initial_json)
+            async with lattice_lock:
+                initial_state = lattice.get_state_for_transmission()
+            if use_msgpack:
+                queue.put_nowait(msgpack_encoder.encode(initial_state))
+            else:
+                queue.put_nowait(orjson.dumps(initial_state, option=orjson.OPT_SERIALIZE_NUMPY))
         except (TypeError, ValueError) as e:
-            logger.error(f"Failed to send initial state: {e}")
+            logger.error("Failed to send initial state: %s", e)
             return
         
+        clients.add(websocket)
+        logger.info("Client connected. Total clients: %d", len(connected_clients) + len(msgpack_clients))
+        
         # Listen for client messages (mouse interactions, etc.)
         while True:
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                # Browsers send text frames; msgspec decodes the str directly
+                message = client_message_decoder.decode(await websocket.receive_text())
                 
                 # Handle different message types
-                message_type = message.get('type')
-                
-                if message_type == 'mouse_influence':
-                    # Apply mouse influence to lattice
-                    mouse_data = message.get('data', {})
-                    # This will be handled in the next update cycle
-                    # Store mouse influence for next frame
-                    lattice.mouse_influence_queue.append(mouse_data)
-                
-                elif message_type == 'parameter_update':
-                    # Update simulation parameters
-                    params = message.get('data', {})
-                    lattice.update_params(params)
-                    logger.info(f"Parameters updated: {params}")
-                
-                elif message_type == 'add_node':
-                    # Add new consciousness node
-                    node_data = message.get('data', {})
-                    lattice.add_node(node_data.get('x', 0), node_data.get('y', 0))
-                    logger.info(f"Node added at ({node_data.get('x', 0)}, {node_data.get('y', 0)})")
-                
-                elif message_type == 'quantum_collapse':
-                    # Trigger quantum collapse
-                    collapse_data = message.get('data', {})
-                    lattice.quantum_collapse(collapse_data.get('x', 0), collapse_data.get('y', 0))
-                    logger.info(f"Quantum collapse at ({collapse_data.get('x', 0)}, {collapse_data.get('y', 0)})")
-                
-                elif message_type == 'set_mode':
-                    # Change visualization mode
-                    mode = message.get('data', {}).get('mode', 'consciousness')
-                    lattice.set_mode(UniverseMode(mode))
-                    logger.info(f"Mode changed to: {mode}")
+                match message:
+                    case MouseInfluenceMessage(data=mouse_data):
+                        # Replaces any influence this client sent since the last frame
+                        pending_mouse[websocket] = mouse_data
+                    
+                    case ParameterUpdateMessage(data=param_data):
+                        # Update simulation parameters
+                        params = msgspec.to_builtins(param_data)
+                        async with lattice_lock:
+                            lattice.update_params(params)
+                        logger.info("Parameters updated: %s", params)
+                    
+                    case AddNodeMessage(data=point):
+                        # Add new consciousness node
+                        async with lattice_lock:
+                            lattice.add_node(point.x, point.y)
+                        logger.info("Node added at (%s, %s)", point.x, point.y)
+                    
+                    case QuantumCollapseMessage(data=point):
+                        # Trigger quantum collapse
+                        async with lattice_lock:
+                            lattice.quantum_collapse(point.x, point.y)
+                        logger.info("Quantum collapse at (%s, %s)", point.x, point.y)
+                    
+                    case SetModeMessage(data=ModeData(mode=mode)):
+                        # Change visualization mode
+                        async with lattice_lock:
+                            lattice.set_mode(mode)
+                        logger.info("Mode changed to: %s", mode.value)
                     
             except asyncio.TimeoutError:
                 continue
-            except json.JSONDecodeError:
-                logger.warning("Invalid JSON received from client")
+            except msgspec.DecodeError as e:
+                # Malformed JSON, an unknown message type or mode, or a field of the wrong type
+                logger.warning("Invalid message received from client: %s", e)
             except Exception as e:
-                logger.error(f"Error processing client message: {e}")
+                logger.error("Error processing client message: %s", e)
                 break
     
     except WebSocketDisconnect:
         logger.info("Client disconnected normally")
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
+    finally:
+        clients.discard(websocket)
+        pending_mouse.pop(websocket, None)
+        await stop_client_writer(websocket, writer)
+        logger.info("Client removed. Total clients: %d", len(connected_clients) + len(msgpack_clients))
+
+@app.websocket("/ws/state")
+async def state_stream_endpoint(websocket: WebSocket):
+    """WebSocket endpoint pushing delta-encoded state after every simulation tick.
+
+    Frames are orjson-encoded bytes with 'added', 'changed' and 'removed'
+    node lists, the lattice 'version' and a 'keyframe' flag. The first frame
+    and one frame in every KEYFRAME_INTERVAL are keyframes listing every node
+    as added. GET /api/state returns the same full state over HTTP.
+    """
+    await websocket.accept()
+    state_clients[websocket] = None
+    logger.info("Delta client connected. Total delta clients: %d", len(state_clients))
+    
+    try:
+        # Frames are pushed by the simulation loop; just wait for the client to leave
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        logger.info("Delta client disconnected normally")
+    except Exception as e:
+        logger.error("Delta WebSocket error: %s", e)
     finally:
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
-        logger.info(f"Client removed. Total clients: {len(connected_clients)}")
+        state_clients.pop(websocket, None)
+
+@app.websocket("/ws/binary")
+async def binary_stream_endpoint(websocket: WebSocket):
+    """WebSocket endpoint pushing packed node columns after every simulation tick.
+
+    Each frame is laid out as described in encode_binary_frame, so clients
+    read node fields as typed arrays instead of parsing JSON. ?precision=f2
+    sends float fields as float16 and ?precision=u1 as uint8 quantized per
+    field, which is enough for display; the default is float32.
+    """
+    float_format = websocket.query_params.get('precision', 'f4')
+    if float_format not in BINARY_FLOAT_FORMATS:
+        await websocket.close(code=1008)
+        return
+    
+    await websocket.accept()
+    clients = binary_clients[float_format]
+    queue, writer = start_client_writer(websocket)
+    async with lattice_lock:
+        queue.put_nowait(encode_binary_frame(lattice.get_state_binary(float_format)))
+    clients.add(websocket)
+    logger.info("Binary client connected. Total %s binary clients: %d", float_format, len(clients))
+    
+    try:
+        # Frames are pushed by the simulation loop; just wait for the client to leave
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        logger.info("Binary client disconnected normally")
+    except Exception as e:
+        logger.error("Binary WebSocket error: %s", e)
+    finally:
+        clients.discard(websocket)
+        await stop_client_writer(websocket, writer)
 
 # REST API Endpoints for external control
 
 @app.get("/")
-async def root():
-    """Serve the main application."""
-    return FileResponse("static/index.html")
+async def root(request: Request):
+    """Serve the main application, answering a matching If-None-Match with 304.
+
+    The page is cached at startup, so edits to static/index.html need a restart.
+    """
+    etag = app.state.index_etag
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=app.state.index_bytes, media_type="text/html", headers=headers)
 
 @app.get("/api/status")
 async def get_status():
     """Get current simulation status."""
     return {
         "running": simulation_running,
-        "connected_clients": len(connected_clients),
+        "connected_clients": len(connected_clients) + len(msgpack_clients),
         "node_count": len(lattice.nodes),
         "cluster_count": len(lattice.clusters),
         "target_fps": target_fps,
         "time": lattice.time
     }
 
+@app.get("/api/state")
+async def get_state():
+    """Get the full lattice state (initial sync for /ws/state clients)."""
+    async with lattice_lock:
+        return ORJSONResponse(lattice.get_state_for_transmission())
+
 @app.get("/api/stats")
 async def get_stats():
     """Get detailed lattice statistics."""
-    return lattice._calculate_global_consciousness()
+    async with lattice_lock:
+        return lattice._calculate_global_consciousness()
 
 @app.post("/api/parameters")
 async def update_parameters(params: ParameterUpdate):
     """Update simulation parameters."""
     param_dict = params.dict(exclude_unset=True)
-    lattice.update_params(param_dict)
+    async with lattice_lock:
+        lattice.update_params(param_dict)
     return {"status": "updated", "parameters": param_dict}
 
 @app.get("/api/parameters")
@@ -250,19 +651,37 @@ async def get_parameters():
     """Get current simulation parameters."""
     return lattice.params
 
+@app.post("/api/update")
+async def advance_simulation():
+    """Compatibility endpoint for polling clients (static/js/app_demo.js).
+
+    The simulation loop advances the lattice on its own, so this only
+    reports the current simulation time.
+    """
+    return {"status": "ok", "time": lattice.time}
+
 @app.post("/api/nodes")
 async def create_node(node: NodeCreate):
     """Create a new consciousness node."""
-    new_node = lattice.add_node(node.x, node.y)
+    async with lattice_lock:
+        new_node = lattice.add_node(node.x, node.y).to_dict()
     return {
         "status": "created",
-        "node": new_node.to_dict()
+        "node": new_node
     }
 
+@app.post("/api/nodes/bulk")
+async def create_nodes_bulk(bulk: NodeBulkCreate):
+    """Create several consciousness nodes in one request."""
+    async with lattice_lock:
+        ids = [lattice.add_node(x, y).node_id for x, y in bulk.points]
+    return {"status": "created", "ids": ids}
+
 @app.post("/api/collapse")
 async def trigger_collapse(collapse: QuantumCollapse):
     """Trigger quantum collapse at specified location."""
-    lattice.quantum_collapse(collapse.x, collapse.y)
+    async with lattice_lock:
+        lattice.quantum_collapse(collapse.x, collapse.y)
     return {
         "status": "triggered",
         "location": {"x": collapse.x, "y": collapse.y}
@@ -272,7 +691,8 @@ async def trigger_collapse(collapse: QuantumCollapse):
 async def set_mode(mode: str):
     """Set visualization mode."""
     try:
-        lattice.set_mode(UniverseMode(mode))
+        async with lattice_lock:
+            lattice.set_mode(UniverseMode(mode))
         return {"status": "updated", "mode": mode}
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid mode: {mode}")
@@ -280,14 +700,15 @@ async def set_mode(mode: str):
 @app.post("/api/reset")
 async def reset_simulation():
     """Reset the entire simulation."""
-    global lattice
-    lattice = ConsciousnessLattice(grid_size=128, universe_count=3)
+    async with lattice_lock:
+        lattice.reset_in_place()
     return {"status": "reset"}
 
 @app.get("/api/export")
 async def export_state():
     """Export current lattice state."""
-    return lattice.get_state_for_transmission()
+    async with lattice_lock:
+        return ORJSONResponse(lattice.get_state_for_transmission())
 
 # Serve static files (Three.js frontend)
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -295,11 +716,19 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 if __name__ == "__main__":
     import uvicorn
     
-    # Run with uvicorn for development
+    try:
+        import uvloop  # noqa: F401
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
+    
+    # Run with uvicorn (use run_server.py --reload for hot-reloading)
     uvicorn.run(
         "src.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop=event_loop,
+        # Compress WebSocket frames when the client offers permessage-deflate
+        ws_per_message_deflate=True,
         log_level="info"
     )
\ No newline at end of file
@@ -13,6 +13,7 @@ class ConsciousnessApp {
         this.reconnectAttempts = 0;
         this.maxReconnectAttempts = 5;
         this.reconnectDelay = 1000;
+        this.textDecoder = new TextDecoder();
         
         // Current interaction state
         this.interactionMode = 'push';
@@ -119,6 +120,8 @@ class ConsciousnessApp {
         
         try {
             this.ws = new WebSocket(wsUrl);
+            // State frames arrive as binary messages holding UTF-8 JSON
+            this.ws.binaryType = 'arraybuffer';
             
             this.ws.onopen = () => {
                 console.log('WebSocket connected');
@@ -129,7 +132,10 @@ class ConsciousnessApp {
             
             this.ws.onmessage = (event) => {
                 try {
-                    const data = JSON.parse(event.data);
+                    const text = typeof event.data === 'string'
+                        ? event.data
+                        : this.textDecoder.decode(event.data);
+                    const data = JSON.parse(text);
                     this.handleServerMessage(data);
                 } catch (error) {
                     console.error('Error parsing WebSocket message:', error);
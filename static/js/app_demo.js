@@ -209,14 +209,10 @@ class ConsciousnessApp {
     async startPolling() {
         this.isRunning = true;
         
-        // First update the lattice
-        await this.updateLattice();
-        
-        // Start polling loop
+        // The server advances the lattice on its own; we only poll for state
         this.pollInterval = setInterval(async () => {
             if (this.isRunning) {
                 await this.fetchAndUpdateState();
-                await this.updateLattice();
             }
         }, this.pollDelay);
     }
@@ -253,22 +249,6 @@ class ConsciousnessApp {
         }
     }
 
-    async updateLattice() {
-        try {
-            const response = await fetch('/api/update', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({})
-            });
-            
-            if (!response.ok) {
-                throw new Error('Update failed');
-            }
-        } catch (error) {
-            console.error('Error updating lattice:', error);
-        }
-    }
-
     updateStats(stats) {
         // Update UI elements
         document.getElementById('nodeCount').textContent = stats.node_count || 0;